@@ -0,0 +1,77 @@
+"""On-disk cache of per-address treasury query results, so re-runs over a mostly unchanged address list skip the network."""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_CACHE_PATH = Path.home() / ".pocketknife" / "cache.sqlite3"
+DEFAULT_TTL = 60.0
+
+# Bumped when the results table changes; older tables are dropped (it is only a cache)
+SCHEMA_VERSION = 2
+
+
+class BalanceCache:
+    """
+    Results keyed by (query kind, address), e.g. ("node_stakes", "pokt1..."), with
+    the block height they were read at.
+
+    An entry is fresh if it was stored at the current height (set height before
+    reading; chain state cannot have changed) or less than ttl seconds ago.
+    Stale entries are overwritten on the next store. One connection is shared by
+    all threads, guarded by a lock.
+    """
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH, ttl: float = DEFAULT_TTL):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.height: Optional[int] = None
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        if self._db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self._db.execute("DROP TABLE IF EXISTS results")
+            self._db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "kind TEXT NOT NULL, address TEXT NOT NULL, value TEXT NOT NULL, "
+            "height INTEGER, stored_at REAL NOT NULL, "
+            "PRIMARY KEY (kind, address))"
+        )
+        self._db.commit()
+
+    def get_many(self, kind: str, addresses: list[str]) -> dict:
+        """Return {address: value} for the addresses with a fresh entry."""
+        if not addresses:
+            return {}
+        oldest = time.time() - self.ttl
+        found = {}
+        with self._lock:
+            # Stay well under SQLite's bound-parameter limit
+            for i in range(0, len(addresses), 500):
+                chunk = addresses[i:i + 500]
+                rows = self._db.execute(
+                    f"SELECT address, value FROM results WHERE kind = ? AND (height = ? OR stored_at >= ?) "
+                    f"AND address IN ({','.join('?' * len(chunk))})",
+                    (kind, self.height, oldest, *chunk),
+                )
+                found.update((address, json.loads(value)) for address, value in rows)
+        return found
+
+    def set_many(self, kind: str, values: dict) -> None:
+        """Store {address: value} (any JSON-serializable value) for kind at the current height."""
+        if not values:
+            return
+        now = time.time()
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO results (kind, address, value, height, stored_at) VALUES (?, ?, ?, ?, ?)",
+                [(kind, address, json.dumps(value), self.height, now) for address, value in values.items()],
+            )
+            self._db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,60 @@
+"""Minimal bech32 (BIP-173) encoding, used to convert between pokt address prefixes."""
+
+import functools
+
+CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+CHARSET_INDEX = {char: value for value, char in enumerate(CHARSET)}
+GENERATOR = (0x3B6A57B2, 0x26508E6D, 0x1EA119FA, 0x3D4233DD, 0x2A1462B3)
+
+
+def _polymod(values: list[int]) -> int:
+    checksum = 1
+    for value in values:
+        top = checksum >> 25
+        checksum = (checksum & 0x1FFFFFF) << 5 ^ value
+        for i in range(5):
+            if (top >> i) & 1:
+                checksum ^= GENERATOR[i]
+    return checksum
+
+
+@functools.lru_cache(maxsize=None)
+def _hrp_expand(hrp: str) -> tuple[int, ...]:
+    # Only a couple of prefixes (pokt, poktvaloper) are ever used
+    return tuple([ord(c) >> 5 for c in hrp] + [0] + [ord(c) & 31 for c in hrp])
+
+
+def decode(address: str) -> tuple[str, list[int]]:
+    """
+    Split a bech32 address into its human-readable prefix and 5-bit data words.
+    Raises ValueError if the address is malformed or the checksum does not match.
+    """
+    if address.lower() != address and address.upper() != address:
+        raise ValueError("Mixed-case bech32 address")
+    address = address.lower()
+    pos = address.rfind("1")
+    if pos < 1 or pos + 7 > len(address):
+        raise ValueError("Invalid bech32 separator position")
+
+    hrp = address[:pos]
+    try:
+        data = [CHARSET_INDEX[c] for c in address[pos + 1:]]
+    except KeyError as e:
+        raise ValueError(f"Invalid bech32 character {e.args[0]!r}") from None
+
+    if _polymod([*_hrp_expand(hrp), *data]) != 1:
+        raise ValueError("Invalid bech32 checksum")
+    return hrp, data[:-6]
+
+
+def encode(hrp: str, data: list[int]) -> str:
+    """Build a bech32 address from a prefix and 5-bit data words."""
+    polymod = _polymod([*_hrp_expand(hrp), *data, 0, 0, 0, 0, 0, 0]) ^ 1
+    checksum = [(polymod >> 5 * (5 - i)) & 31 for i in range(6)]
+    return hrp + "1" + "".join(CHARSET[d] for d in data + checksum)
+
+
+def convert_prefix(address: str, hrp: str) -> str:
+    """Re-encode a bech32 address under another prefix (e.g. poktvaloper1... -> pokt1...)."""
+    _, data = decode(address)
+    return encode(hrp, data)
@@ -1,12 +1,28 @@
 import typer
+import functools
 import subprocess
 import json
+import re
+import shlex
+import sys
+from collections import Counter
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from rich.console import Console
-from rich.table import Table
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import threading
+from rich.text import Text
+from . import bech32, fastjson, rpc
+from .rpc import PocketdSession, QueryError, QueryNotFound, QueryTimeout
+
+# Tables, progress bars and thread pools are imported where they are used,
+# so `--help` and the lightweight commands start faster
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
+    from rich.progress import Progress
+    from rich.table import Table
+
+    from .balance_cache import BalanceCache
 
 app = typer.Typer(
     help="Pocketknife CLI: Syntactic sugar for poktroll operations.",
@@ -17,12 +33,122 @@ app = typer.Typer(
 # Create a subcommand group for specific treasury operations
 treasury_app = typer.Typer(help="Specific treasury operations (use main 'treasury' command for full analysis)")
 app.add_typer(treasury_app, name="treasury-tools")
-console = Console()
+
+# Plain output (no colors, no table borders) when piped or with --plain
+PLAIN_OUTPUT = not sys.stdout.isatty()
+console = Console(highlight=not PLAIN_OUTPUT)
+
+# Bech32 account / validator operator addresses (20-byte payload + checksum)
+POKT_ADDR_RE = re.compile(r'^pokt1[02-9ac-hj-np-z]{38}$').match
+POKT_VALOPER_RE = re.compile(r'^poktvaloper1[02-9ac-hj-np-z]{38}$').match
+
+# pocketd coin strings such as "300491.883966650000000000upokt"
+UPOKT_AMOUNT_RE = re.compile(r'^(\d+(?:\.\d+)?)upokt$').match
+
+# Transaction hash in pocketd broadcast output (text or JSON)
+TXHASH_RE = re.compile(r'txhash"?:\s*"?([0-9A-Fa-f]{64})')
+
+# "name: <key>" lines in `pocketd keys list` YAML output
+KEY_NAME_RE = re.compile(r'^[ \t]*name: [ \t]*(.*?)[ \t]*$', re.MULTILINE)
+KEY_ENTRY_RE = re.compile(r'^- ', re.MULTILINE)
+
+# "address: <addr>" line in `pocketd keys add/show` YAML output
+KEY_ADDRESS_RE = re.compile(r'^[ \t]*(?:- )?address:[ \t]*(\S+)', re.MULTILINE)
+
+# pocketd subprocess query path (--use-cli)
+pocketd_session = PocketdSession()
+
+# Liquid balance lookups sent per batched abci_query request
+LIQUID_BATCH_SIZE = 100
+
+# Liquid balances (POKT) fetched during this run, so an address that shows up
+# again (e.g. a validator's account that also delegates) is queried once
+liquid_balance_cache: dict[str, float] = {}
+
+# From this many node/app stake addresses on, stakes are read from one paginated listing of
+# every supplier/application (~6k suppliers is ~13 pages) instead of one query per address
+BULK_STAKE_THRESHOLD = 100
+
+# Stakes ({"denom", "amount"}) from those listings, keyed by operator/application address;
+# None until a listing is loaded, and absent addresses have no stake
+supplier_stake_listing: Optional[dict[str, dict]] = None
+application_stake_listing: Optional[dict[str, dict]] = None
+
+# On-disk cache of treasury query results across runs (left as None with --no-cache)
+balance_cache: Optional["BalanceCache"] = None
+
+# POKT amount as shown in report rows (1,234.56)
+format_pokt = "{:,.2f}".format
+
+# Status cells shared by every report table, pre-styled so rows skip markup parsing
+OK_CELL = Text("✓", style="green")
+FAIL_CELL = Text("✗", style="red")
+
+
+def new_table(title: str) -> "Table":
+    """Create a report table; borderless in plain-output mode."""
+    from rich.table import Table
+
+    if PLAIN_OUTPUT:
+        return Table(title=title, box=None, show_edge=False)
+    return Table(title=title)
+
+
+def add_rows(table: "Table", rows: list[tuple]) -> None:
+    """Add pre-formatted rows to a Rich table."""
+    add_row = table.add_row
+    for row in rows:
+        add_row(*row)
+
+
+def new_progress() -> "Progress":
+    """
+    Create the progress display used for parallel balance queries; it is cleared once
+    the queries finish, and hidden when output is not a terminal.
+    """
+    from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, MofNCompleteColumn
+
+    return Progress(
+        SpinnerColumn(), TextColumn("{task.description}"), BarColumn(), MofNCompleteColumn(),
+        console=console, transient=True, disable=not console.is_terminal,
+    )
+
+
+@contextmanager
+def query_progress(description: str, total: int, progress: Optional["Progress"] = None):
+    """
+    Track `total` queries as one progress task and yield its advance callback.
+    The task is added to `progress` when given (so concurrent categories share a
+    single live display), otherwise to a progress bar shown for the duration.
+    """
+    if progress is not None:
+        task = progress.add_task(description, total=total)
+        yield lambda count=1: progress.advance(task, count)
+        return
+
+    with new_progress() as progress:
+        task = progress.add_task(description, total=total)
+        yield lambda count=1: progress.advance(task, count)
+
+
+def worker_pool(max_workers: int, executor: Optional["ThreadPoolExecutor"] = None):
+    """
+    Context manager for the executor that runs a category's queries: `executor` when
+    given (shared by concurrent categories and left running for its owner), otherwise
+    a new pool of max_workers threads.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if executor is not None:
+        return nullcontext(executor)
+    return ThreadPoolExecutor(max_workers=max_workers)
+
 
 @app.callback(invoke_without_command=True)
 def main(
     ctx: typer.Context,
     h: bool = typer.Option(False, "-h", help="Show this help message and exit", hidden=True),
+    plain: bool = typer.Option(False, "--plain", help="Plain text output for scripting (no colors or table borders)"),
 ):
     """
     Pocketknife CLI: Syntactic sugar for poktroll operations.
@@ -39,6 +165,11 @@ def main(
     - unstake: Mass-unstake operations
     - treasury-tools: Specific treasury operations
     """
+    global console, PLAIN_OUTPUT
+    if plain:
+        PLAIN_OUTPUT = True
+        console = Console(no_color=True, highlight=False)
+
     if h or ctx.invoked_subcommand is None:
         console.print("[bold blue]Pocketknife CLI[/bold blue]")
         console.print("Syntactic sugar for poktroll operations.\n")
@@ -59,7 +190,11 @@ def main(
         ctx.exit(0)
 
 @treasury_app.callback(invoke_without_command=True)
-def treasury_main(ctx: typer.Context):
+def treasury_main(
+    ctx: typer.Context,
+    no_cache: bool = typer.Option(False, "--no-cache", help="Query every address instead of reusing recent results"),
+    cache_ttl: float = typer.Option(60.0, "--cache-ttl", help="Seconds a cached result stays valid (default: 60)"),
+):
     """
     Specific treasury operations (use main 'treasury' command for full analysis).
     
@@ -70,6 +205,8 @@ def treasury_main(ctx: typer.Context):
     - node-stakes: Calculate node stake balances
     - validator-stakes: Calculate validator stake balances
     """
+    if ctx.invoked_subcommand is not None and not no_cache:
+        enable_balance_cache(cache_ttl)
     if ctx.invoked_subcommand is None:
         console.print("[bold blue]Treasury Tools[/bold blue]")
         console.print("Specific treasury operations (use main 'treasury' command for full analysis).\n")
@@ -80,8 +217,10 @@ def treasury_main(ctx: typer.Context):
         console.print("  [cyan]liquid-balance[/cyan]   Calculate liquid balances")
         console.print("  [cyan]node-stakes[/cyan]      Calculate node stake balances")
         console.print("  [cyan]validator-stakes[/cyan] Calculate validator stake balances")
-        console.print("\n[dim]All subcommands support both text files (one address per line)")
-        console.print("and JSON files (extracts from appropriate array section).[/dim]")
+        console.print("\n[dim]All subcommands support both text files (one address per line)[/dim]")
+        console.print("[dim]and JSON files (extracts from appropriate array section).[/dim]")
+        console.print("\n[dim]Results are reused for 60 seconds across runs; pass --no-cache (or --cache-ttl)[/dim]")
+        console.print("[dim]before the subcommand to change that.[/dim]")
         
         console.print("\n[dim]Use 'pocketknife treasury-tools [SUBCOMMAND] --help' for more information.[/dim]")
         ctx.exit(0)
@@ -160,7 +299,7 @@ def add_services(
         raise typer.Exit(1)
 
     # Check if pocketd command is available
-    if subprocess.run(["which", "pocketd"], capture_output=True).returncode != 0:
+    if rpc.pocketd_path() is None:
         console.print("[red]Error: pocketd command not found.[/red]")
         raise typer.Exit(1)
 
@@ -253,7 +392,7 @@ def add_services(
             try:
                 # For 'os' keyring backend, provide password via stdin
                 stdin_input = f"{pwd}\n" if keyring_backend == "os" else None
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=120, input=stdin_input)
+                result = subprocess.run([rpc.pocketd_path(), *cmd[1:]], capture_output=True, text=True, timeout=120, input=stdin_input)
 
                 # Check if successful (exit code 0 and no meaningful raw_log error)
                 if result.returncode == 0 and ('raw_log: ""' in result.stdout or 'raw_log' not in result.stdout):
@@ -340,7 +479,7 @@ def delete_keys(
         raise typer.Exit(0)
 
     # Check if pocketd command is available
-    if not subprocess.run(["which", "pocketd"], capture_output=True).returncode == 0:
+    if rpc.pocketd_path() is None:
         console.print("[red]Error: pocketd command not found.[/red]")
         raise typer.Exit(1)
 
@@ -367,16 +506,15 @@ def delete_keys(
             raise typer.Exit(0)
         console.print()
 
-    # Counter for tracking deletions
+    # Counters for the summary (tallied once the deletions have run)
     total_count = 0
     success_count = 0
     error_count = 0
-    not_found_count = 0
 
     # Get list of all keys in keyring first
     console.print(f"[yellow]Getting list of all keys in keyring '{keyring_name}'...[/yellow]")
 
-    list_cmd = ["pocketd", "keys", "list", "--keyring-backend", keyring_name]
+    list_cmd = [rpc.pocketd_path(), "keys", "list", "--keyring-backend", keyring_name]
 
     # For 'os' keyring backend, provide password via stdin
     if keyring_name == "os":
@@ -398,28 +536,28 @@ def delete_keys(
         raise typer.Exit(1)
     
     # Extract key names from YAML output format (lines with "name: keyname")
-    key_names = []
-    lines = result.stdout.split('\n')
-    for line in lines:
-        stripped_line = line.strip()
-        if stripped_line.startswith('name: '):
-            key_name = stripped_line.split('name: ')[1].strip()
-            key_names.append(key_name)
-    all_key_names = key_names
+    key_names = KEY_NAME_RE.findall(result.stdout)
+
+    # Fall back to a real YAML parse if the fast path missed any list entries
+    if len(key_names) != len(KEY_ENTRY_RE.findall(result.stdout)):
+        import yaml
+
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        entries = yaml.load(result.stdout, Loader=loader) or []
+        key_names = [str(entry["name"]) for entry in entries if isinstance(entry, dict) and "name" in entry]
     
-    if not all_key_names:
+    if not key_names:
         console.print(f"[yellow]No keys found in keyring '{keyring_name}'[/yellow]")
         raise typer.Exit(0)
     
-    # Filter keys by pattern if provided
+    # Filter keys by pattern if provided (simple substring match); a blank name is never deleted
+    key_names_to_delete = [key for key in key_names if key and (not pattern or pattern in key)]
     if pattern:
-        key_names_to_delete = [key for key in all_key_names if pattern in key]
-        console.print(f"[cyan]Found {len(key_names_to_delete)} keys containing '{pattern}' out of {len(all_key_names)} total keys:[/cyan]")
+        console.print(f"[cyan]Found {len(key_names_to_delete)} keys containing '{pattern}' out of {len(key_names)} total keys:[/cyan]")
         if not key_names_to_delete:
             console.print(f"[yellow]No keys found containing pattern '{pattern}'[/yellow]")
             raise typer.Exit(0)
     else:
-        key_names_to_delete = all_key_names
         console.print(f"[cyan]Found {len(key_names_to_delete)} keys to delete:[/cyan]")
     
     # Show keys that will be deleted
@@ -434,32 +572,54 @@ def delete_keys(
         console.print("[yellow]Deleting all keys...[/yellow]")
     console.print("----------------------------------------")
     
-    for key_name in key_names_to_delete:
-        if key_name:
-            total_count += 1
-
-            cmd = ["pocketd", "keys", "delete", "--keyring-backend", keyring_name, "--yes", key_name]
-
-            if dry_run:
-                console.print(f"[{total_count}] {' '.join(cmd)}")
-            else:
-                console.print(f"[{total_count}] Deleting key: {key_name} ... ", end="")
-
-                # For 'os' keyring backend, provide password via stdin
-                if keyring_name == "os":
-                    delete_stdin = f"{pwd}\n"
-                else:
-                    delete_stdin = None
+    delete_cmd = ["pocketd", "keys", "delete", "--keyring-backend", keyring_name, "--yes"]
 
-                result = subprocess.run(cmd, capture_output=True, text=True, input=delete_stdin)
-                
-                if result.returncode == 0:
-                    success_count += 1
-                    console.print("[green]✅ Success[/green]")
-                else:
-                    error_count += 1
-                    console.print("[red]❌ Failed[/red]")
-                    console.print(f"  [red]Error: {result.stderr.strip()}[/red]")
+    if dry_run:
+        cmd_prefix = shlex.join(delete_cmd)
+        for i, key_name in enumerate(key_names_to_delete, 1):
+            console.print(f"[{i}] {cmd_prefix} {shlex.quote(key_name)}")
+        total_count = len(key_names_to_delete)
+    else:
+        # For 'os' keyring backend, provide password via stdin
+        if keyring_name == "os":
+            delete_stdin = f"{pwd}\n"
+        else:
+            delete_stdin = None
+
+        from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, MofNCompleteColumn
+
+        # Resolved binary path, so the loop does not search PATH for every key
+        run_cmd = [rpc.pocketd_path(), *delete_cmd[1:]]
+
+        # Single progress bar (refreshed at a fixed rate) instead of several prints per key
+        deletions = []
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            console=console,
+            transient=True,
+            refresh_per_second=10,
+        ) as progress:
+            task = progress.add_task("Deleting", total=len(key_names_to_delete))
+            for key_name in key_names_to_delete:
+                progress.update(task, description=f"Deleting {key_name}")
+
+                result = subprocess.run([*run_cmd, key_name], capture_output=True, text=True, input=delete_stdin)
+                deletions.append((key_name, result.returncode, result.stderr))
+                progress.advance(task)
+
+        statuses = [returncode for _, returncode, _ in deletions]
+        total_count = len(statuses)
+        success_count = statuses.count(0)
+        error_count = total_count - success_count
+
+        console.print(f"[green]✅ Deleted {success_count}/{total_count} keys[/green]")
+        for key_name, returncode, stderr in deletions:
+            if returncode != 0:
+                console.print(f"[red]❌ Failed: {key_name}[/red]")
+                console.print(f"  [red]Error: {stderr.strip()}[/red]")
 
     # Display summary
     console.print()
@@ -468,8 +628,6 @@ def delete_keys(
     console.print(f"Total keys processed: {total_count}")
     if not dry_run:
         console.print(f"Successfully deleted: {success_count}")
-        if not_found_count > 0:
-            console.print(f"Keys not found: {not_found_count}")
         console.print(f"Failed deletions: {error_count}")
     console.print("=========================================")
 
@@ -557,7 +715,7 @@ def stake_apps(
         mode = "single"
 
     # Check pocketd
-    if subprocess.run(["which", "pocketd"], capture_output=True).returncode != 0:
+    if rpc.pocketd_path() is None:
         console.print("[red]Error: pocketd command not found.[/red]")
         raise typer.Exit(1)
 
@@ -646,7 +804,7 @@ def stake_apps(
         try:
             # For 'os' keyring backend, provide password via stdin
             stdin_input = f"{pwd}\n" if keyring_backend == "os" else None
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120, input=stdin_input)
+            result = subprocess.run([rpc.pocketd_path(), *cmd[1:]], capture_output=True, text=True, timeout=120, input=stdin_input)
             if result.returncode == 0:
                 console.print(f"[green]✅ Successfully staked application for {from_addr}[/green]")
                 return True
@@ -699,7 +857,7 @@ def stake_apps(
         try:
             # For 'os' keyring backend, provide password via stdin
             stdin_input = f"{pwd}\n" if keyring_backend == "os" else None
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120, input=stdin_input)
+            result = subprocess.run([rpc.pocketd_path(), *cmd[1:]], capture_output=True, text=True, timeout=120, input=stdin_input)
             if result.returncode == 0:
                 console.print(f"[green]✅ Successfully delegated {from_addr} to gateway[/green]")
                 return True
@@ -822,6 +980,7 @@ def fetch_suppliers(
     ctx: typer.Context,
     output_file: Path = typer.Option(None, "--output-file", help="Path to save the operator addresses"),
     owner_address: str = typer.Option(None, "--owner-address", help="Owner address to fetch suppliers for"),
+    verbose: bool = typer.Option(False, "-v", "--verbose", help="Print each operator address as it is found"),
     h: bool = typer.Option(False, "-h", help="Show this help message and exit", hidden=True),
 ):
     """
@@ -830,6 +989,9 @@ def fetch_suppliers(
     Required options:
     --owner-address: Owner address to fetch suppliers for
     --output-file: Path to save the operator addresses
+
+    Optional options:
+    -v, --verbose: Print each operator address as it is found
     """
     if h:
         console.print(ctx.get_help())
@@ -842,19 +1004,26 @@ def fetch_suppliers(
         console.print("[bold]Required Options:[/bold]")
         console.print("  [cyan]--owner-address[/cyan]  Owner address to fetch suppliers for")
         console.print("  [cyan]--output-file[/cyan]    Path to save the operator addresses")
+        console.print("\n[bold]Optional Options:[/bold]")
+        console.print("  [cyan]-v, --verbose[/cyan]    Print each operator address as it is found")
         console.print("\n[bold]Example:[/bold]")
         console.print("  pocketknife fetch-suppliers --owner-address pokt1abc123... --output-file suppliers.txt")
         console.print("\n[dim]Use 'pocketknife fetch-suppliers --help' for full help.[/dim]")
         raise typer.Exit(1)
     
-    # Validate owner address format
-    if not owner_address.startswith("pokt1") or len(owner_address) != 43:
+    # Validate owner address format (and checksum, so a typo fails here rather than after listing every supplier)
+    if not POKT_ADDR_RE(owner_address):
         console.print(f"[red]Invalid owner address format:[/red] {owner_address}")
         console.print("[yellow]Expected format: pokt1... (43 characters)[/yellow]")
         raise typer.Exit(1)
+    try:
+        bech32.decode(owner_address)
+    except ValueError as e:
+        console.print(f"[red]Invalid owner address:[/red] {owner_address} ({e})")
+        raise typer.Exit(1)
     
     # Fetch suppliers
-    operator_addresses = fetch_suppliers_for_owner(owner_address)
+    operator_addresses = fetch_suppliers_for_owner(owner_address, verbose)
     
     if not operator_addresses:
         console.print(f"[red]No suppliers found for owner address: {owner_address}[/red]")
@@ -980,7 +1149,7 @@ def generate_keys(
     output_to_console = output_file is None
 
     # Check if pocketd command is available
-    if subprocess.run(["which", "pocketd"], capture_output=True).returncode != 0:
+    if rpc.pocketd_path() is None:
         console.print("[red]Error: pocketd command not found.[/red]")
         raise typer.Exit(1)
 
@@ -1032,7 +1201,7 @@ def generate_keys(
         console.print(f"[blue]Generating key {i+1}/{num_keys}: {key_name} (index: {current_index})[/blue]")
 
         # Run the pocketd keys add command
-        cmd = ["pocketd", "keys", "add", key_name, "--home", str(home_dir), "--keyring-backend", keyring_backend]
+        cmd = [rpc.pocketd_path(), "keys", "add", key_name, "--home", str(home_dir), "--keyring-backend", keyring_backend]
 
         try:
             # For 'os' keyring backend, provide password via stdin (password + confirmation)
@@ -1046,13 +1215,8 @@ def generate_keys(
 
             if result.returncode == 0:
                 # Extract address from stdout
-                stdout_lines = result.stdout.split('\n')
-                address = ""
-
-                for line in stdout_lines:
-                    if line.strip().startswith('- address:') or line.strip().startswith('address:'):
-                        address = line.split('address:')[1].strip()
-                        break
+                address_match = KEY_ADDRESS_RE.search(result.stdout)
+                address = address_match.group(1) if address_match else ""
 
                 # Extract mnemonic from stderr (it's printed there with the warning message)
                 stderr_lines = result.stderr.split('\n')
@@ -1098,7 +1262,7 @@ def generate_keys(
                 # Now export the private key hex
                 console.print(f"[blue]  Exporting private key for {key_name}...[/blue]")
                 export_cmd = [
-                    "pocketd", "keys", "export", key_name,
+                    rpc.pocketd_path(), "keys", "export", key_name,
                     "--home", str(home_dir),
                     "--keyring-backend", keyring_backend,
                     "--unsafe",
@@ -1276,7 +1440,7 @@ def import_keys(
         home_dir = Path.home() / ".pocket"
 
     # Check if pocketd command is available
-    if subprocess.run(["which", "pocketd"], capture_output=True).returncode != 0:
+    if rpc.pocketd_path() is None:
         console.print("[red]Error: pocketd command not found.[/red]")
         raise typer.Exit(1)
 
@@ -1381,7 +1545,7 @@ def import_keys(
 
                 # Import using mnemonic recovery
                 cmd = [
-                    "pocketd", "keys", "add", key_name,
+                    rpc.pocketd_path(), "keys", "add", key_name,
                     "--recover",
                     "--home", str(home_dir),
                     "--keyring-backend", keyring_backend
@@ -1416,7 +1580,7 @@ def import_keys(
                 # Import using private key hex
                 # For hex import, we use 'pocketd keys import-hex'
                 cmd = [
-                    "pocketd", "keys", "import-hex", key_name, key_secret,
+                    rpc.pocketd_path(), "keys", "import-hex", key_name, key_secret,
                     "--home", str(home_dir),
                     "--keyring-backend", keyring_backend
                 ]
@@ -1442,11 +1606,8 @@ def import_keys(
                 console.print(f"[green]✓ Key {key_name} imported successfully[/green]")
 
                 # Extract and display actual address
-                imported_address = None
-                for line in stdout.split('\n'):
-                    if 'address:' in line.lower():
-                        imported_address = line.split('address:')[1].strip().lstrip('- ')
-                        break
+                address_match = KEY_ADDRESS_RE.search(stdout)
+                imported_address = address_match.group(1) if address_match else None
 
                 if imported_address:
                     console.print(f"[dim]  Imported address: {imported_address}[/dim]")
@@ -1564,7 +1725,7 @@ def export_keys(
         home_dir = Path.home() / ".pocket"
 
     # Check if pocketd command is available
-    if subprocess.run(["which", "pocketd"], capture_output=True).returncode != 0:
+    if rpc.pocketd_path() is None:
         console.print("[red]Error: pocketd command not found.[/red]")
         raise typer.Exit(1)
 
@@ -1645,7 +1806,7 @@ def export_keys(
         try:
             # First, get the address using 'pocketd keys show'
             show_cmd = [
-                "pocketd", "keys", "show", key_name,
+                rpc.pocketd_path(), "keys", "show", key_name,
                 "--home", str(home_dir),
                 "--keyring-backend", keyring_backend
             ]
@@ -1669,11 +1830,8 @@ def export_keys(
                 continue
 
             # Extract address from output
-            address = None
-            for line in show_result.stdout.split('\n'):
-                if 'address:' in line.lower():
-                    address = line.split('address:')[1].strip().lstrip('- ')
-                    break
+            address_match = KEY_ADDRESS_RE.search(show_result.stdout)
+            address = address_match.group(1) if address_match else None
 
             if not address:
                 console.print(f"[red]✗ Failed to extract address for key {key_name}[/red]")
@@ -1685,7 +1843,7 @@ def export_keys(
 
             # Now export the private key hex
             export_cmd = [
-                "pocketd", "keys", "export", key_name,
+                rpc.pocketd_path(), "keys", "export", key_name,
                 "--home", str(home_dir),
                 "--keyring-backend", keyring_backend,
                 "--unsafe",
@@ -1768,6 +1926,9 @@ def treasury(
     ctx: typer.Context,
     addresses_file: Path = typer.Option(None, "--file", help="Path to JSON file with treasury addresses."),
     max_workers: int = typer.Option(10, "--max-workers", help="Maximum concurrent requests (default: 10)"),
+    use_cli: bool = typer.Option(False, "--use-cli", help="Query through the pocketd CLI instead of the node REST API"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Query every address instead of reusing recent results"),
+    cache_ttl: float = typer.Option(60.0, "--cache-ttl", help="Seconds a cached result stays valid (default: 60)"),
     h: bool = typer.Option(False, "-h", help="Show this help message and exit", hidden=True),
 ):
     """
@@ -1780,6 +1941,9 @@ def treasury(
 
     Optional options:
     --max-workers: Maximum concurrent requests (default: 10)
+    --use-cli: Query through the pocketd CLI instead of the node REST API
+    --no-cache: Query every address instead of reusing recent results
+    --cache-ttl: Seconds a cached result stays valid (default: 60)
     """
     if h:
         console.print(ctx.get_help())
@@ -1793,6 +1957,9 @@ def treasury(
         console.print("  [cyan]--file[/cyan]        Path to JSON file with treasury addresses")
         console.print("\n[bold]Optional Options:[/bold]")
         console.print("  [cyan]--max-workers[/cyan]  Maximum concurrent requests (default: 10)")
+        console.print("  [cyan]--use-cli[/cyan]      Query through the pocketd CLI instead of the node REST API")
+        console.print("  [cyan]--no-cache[/cyan]     Query every address instead of reusing recent results")
+        console.print("  [cyan]--cache-ttl[/cyan]    Seconds a cached result stays valid (default: 60)")
         console.print("\n[bold]Example:[/bold]")
         console.print("  pocketknife treasury --file treasury_addresses.json")
         console.print("  pocketknife treasury --file treasury_addresses.json --max-workers 20")
@@ -1804,6 +1971,17 @@ def treasury(
         raise typer.Exit(1)
 
     treasury_data = load_treasury_addresses(addresses_file)
+
+    # Drop malformed addresses before fanning out queries
+    rejected_count = 0
+    for key in ("liquid", "app_stakes", "node_stakes", "validator_stakes", "delegator_stakes"):
+        addresses = treasury_data.get(key, [])
+        is_valid = POKT_VALOPER_RE if key == "validator_stakes" else POKT_ADDR_RE
+        valid_addresses = [addr for addr in addresses if is_valid(addr)]
+        rejected_count += len(addresses) - len(valid_addresses)
+        treasury_data[key] = valid_addresses
+    if rejected_count:
+        console.print(f"[yellow]Warning: Skipping {rejected_count} malformed address(es)[/yellow]")
     
     # Get address lists
     liquid_addresses = treasury_data.get("liquid", [])
@@ -1812,300 +1990,74 @@ def treasury(
     validator_stake_addresses = treasury_data.get("validator_stakes", [])
     delegator_stake_addresses = treasury_data.get("delegator_stakes", [])
     
+    # One pooled REST client (or the pocketd fallback) shared by every worker
+    if use_cli:
+        rpc.set_client(pocketd_session)
+    else:
+        rpc.set_client(rpc.NodeClient(max_connections=max_workers))
+    if not no_cache:
+        enable_balance_cache(cache_ttl)
+    
     # Display execution plan
-    total_addresses = len(liquid_addresses) + len(app_stake_addresses) + len(node_stake_addresses) + len(validator_stake_addresses) + len(delegator_stake_addresses)
+    total_addresses = sum(map(len, (liquid_addresses, app_stake_addresses, node_stake_addresses, validator_stake_addresses, delegator_stake_addresses)))
     console.print(f"[bold blue]Starting parallel treasury analysis...[/bold blue]")
     console.print(f"[dim]Total addresses: {total_addresses} | Max workers: {max_workers}[/dim]")
     
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
     # Run all categories in parallel
-    futures = {}
+    futures = {}  # future -> category
     results = {}
     
-    with ThreadPoolExecutor(max_workers=4) as category_executor:  # One worker per category
-        # Submit category-level tasks
-        if liquid_addresses:
-            console.print(f"[yellow]Querying {len(liquid_addresses)} liquid addresses...[/yellow]")
-            futures['liquid'] = category_executor.submit(query_liquid_balances_parallel, liquid_addresses, max_workers)
-        
-        if app_stake_addresses:
-            console.print(f"[yellow]Querying {len(app_stake_addresses)} app stake addresses...[/yellow]")
-            futures['app_stakes'] = category_executor.submit(query_app_stakes_parallel, app_stake_addresses, max_workers)
-        
-        if node_stake_addresses:
-            console.print(f"[yellow]Querying {len(node_stake_addresses)} node stake addresses...[/yellow]")
-            futures['node_stakes'] = category_executor.submit(query_node_stakes_parallel, node_stake_addresses, max_workers)
-        
-        if validator_stake_addresses:
-            console.print(f"[yellow]Querying {len(validator_stake_addresses)} validator stake addresses...[/yellow]")
-            futures['validator_stakes'] = category_executor.submit(query_validator_stakes_parallel, validator_stake_addresses, max_workers)
-        
-        if delegator_stake_addresses:
-            console.print(f"[yellow]Querying {len(delegator_stake_addresses)} delegator stake addresses...[/yellow]")
-            futures['delegator_stakes'] = category_executor.submit(query_delegator_stakes_parallel, delegator_stake_addresses, max_workers)
-        
-        # Collect results as they complete
-        for category in futures:
-            results[category] = futures[category].result()
-    
-    console.print(f"[green]✓ All queries completed![/green]\n")
-    
-    # Display results for liquid addresses
-    total_liquid_all = 0.0
-    if liquid_addresses and 'liquid' in results:
-        liquid_data = results['liquid']
-        total_liquid_all = liquid_data['total_balance']
-        
-        # Create liquid table
-        liquid_table = Table(title="Liquid Balance Report")
-        liquid_table.add_column("Address", style="cyan", no_wrap=True)
-        liquid_table.add_column("Balance (POKT)", justify="right", style="green")
-        liquid_table.add_column("Status", justify="center")
-        
-        # Add successful results
-        for address, balance in liquid_data['results'].items():
-            liquid_table.add_row(
-                address,
-                f"{balance:,.2f}",
-                "[green]✓[/green]"
-            )
-        
-        # Add failed results
-        for address, error in liquid_data['failed']:
-            liquid_table.add_row(
-                address,
-                "0.00",
-                "[red]✗[/red]"
-            )
-        
-        # Add total
-        liquid_table.add_section()
-        liquid_table.add_row(
-            "[bold]TOTAL[/bold]",
-            f"[bold green]{total_liquid_all:,.2f}[/bold green]",
-            f"[dim]{len(liquid_data['results'])}/{len(liquid_addresses)}[/dim]"
-        )
-        
-        console.print(liquid_table)
-        
-        if liquid_data['failed']:
-            console.print(f"\n[red]Failed liquid queries ({len(liquid_data['failed'])}):[/red]")
-            for address, error in liquid_data['failed']:
-                console.print(f"  [red]•[/red] {address}: {error}")
-    
-    # Display results for app stake addresses
-    total_app_stakes = 0.0
-    if app_stake_addresses and 'app_stakes' in results:
-        app_data = results['app_stakes']
-        total_app_stakes = app_data['total_combined']
-        
-        # Create app stakes table
-        app_table = Table(title="App Stake Balance Report")
-        app_table.add_column("Address", style="cyan", no_wrap=True)
-        app_table.add_column("Liquid (POKT)", justify="right", style="green")
-        app_table.add_column("Staked (POKT)", justify="right", style="blue")
-        app_table.add_column("Total (POKT)", justify="right", style="magenta")
-        app_table.add_column("Status", justify="center")
-        
-        # Add successful results
-        for address, balance_data in app_data['results'].items():
-            app_table.add_row(
-                address,
-                f"{balance_data['liquid']:,.2f}",
-                f"{balance_data['staked']:,.2f}",
-                f"{balance_data['total']:,.2f}",
-                "[green]✓[/green]"
-            )
-        
-        # Add failed results
-        for address, error in app_data['failed']:
-            app_table.add_row(
-                address,
-                "0.00",
-                "0.00",
-                "0.00",
-                "[red]✗[/red]"
-            )
-        
-        # Add total
-        app_table.add_section()
-        app_table.add_row(
-            "[bold]TOTAL[/bold]",
-            f"[bold green]{app_data['total_liquid']:,.2f}[/bold green]",
-            f"[bold blue]{app_data['total_staked']:,.2f}[/bold blue]",
-            f"[bold magenta]{total_app_stakes:,.2f}[/bold magenta]",
-            f"[dim]{len(app_data['results'])}/{len(app_stake_addresses)}[/dim]"
-        )
-        
-        console.print("\n")
-        console.print(app_table)
-        
-        if app_data['failed']:
-            console.print(f"\n[red]Failed app stake queries ({len(app_data['failed'])}):[/red]")
-            for address, error in app_data['failed']:
-                console.print(f"  [red]•[/red] {address}: {error}")
-    
-    # Display results for node stake addresses
-    total_node_stakes = 0.0
-    if node_stake_addresses and 'node_stakes' in results:
-        node_data = results['node_stakes']
-        total_node_stakes = node_data['total_combined']
-        
-        # Create node stakes table
-        node_table = Table(title="Node Stake Balance Report")
-        node_table.add_column("Address", style="cyan", no_wrap=True)
-        node_table.add_column("Liquid (POKT)", justify="right", style="green")
-        node_table.add_column("Staked (POKT)", justify="right", style="blue")
-        node_table.add_column("Total (POKT)", justify="right", style="magenta")
-        node_table.add_column("Status", justify="center")
-        
-        # Add successful results
-        for address, balance_data in node_data['results'].items():
-            node_table.add_row(
-                address,
-                f"{balance_data['liquid']:,.2f}",
-                f"{balance_data['staked']:,.2f}",
-                f"{balance_data['total']:,.2f}",
-                "[green]✓[/green]"
-            )
-        
-        # Add failed results
-        for address, error in node_data['failed']:
-            node_table.add_row(
-                address,
-                "0.00",
-                "0.00",
-                "0.00",
-                "[red]✗[/red]"
-            )
-        
-        # Add total
-        node_table.add_section()
-        node_table.add_row(
-            "[bold]TOTAL[/bold]",
-            f"[bold green]{node_data['total_liquid']:,.2f}[/bold green]",
-            f"[bold blue]{node_data['total_staked']:,.2f}[/bold blue]",
-            f"[bold magenta]{total_node_stakes:,.2f}[/bold magenta]",
-            f"[dim]{len(node_data['results'])}/{len(node_stake_addresses)}[/dim]"
+    # Categories with addresses to query: (key, label, addresses, query function, report title, report columns)
+    plan = [
+        entry
+        for entry in (
+            ('liquid', 'liquid', liquid_addresses, query_liquid_balances_parallel, "Liquid Balance Report", LIQUID_COLUMNS),
+            ('app_stakes', 'app stake', app_stake_addresses, query_app_stakes_parallel, "App Stake Balance Report", APP_STAKE_COLUMNS),
+            ('node_stakes', 'node stake', node_stake_addresses, query_node_stakes_parallel, "Node Stake Balance Report", NODE_STAKE_COLUMNS),
+            ('validator_stakes', 'validator stake', validator_stake_addresses, query_validator_stakes_parallel, "Validator Stake Balance Report", VALIDATOR_STAKE_COLUMNS),
+            ('delegator_stakes', 'delegator stake', delegator_stake_addresses, query_delegator_stakes_parallel, "Delegator Stake Balance Report", DELEGATOR_STAKE_COLUMNS),
         )
-        
-        console.print("\n")
-        console.print(node_table)
-        
-        if node_data['failed']:
-            console.print(f"\n[red]Failed node stake queries ({len(node_data['failed'])}):[/red]")
-            for address, error in node_data['failed']:
-                console.print(f"  [red]•[/red] {address}: {error}")
+        if entry[2]
+    ]
+    console.print("[yellow]Querying: " + ", ".join(f"{len(addresses)} {label}" for _, label, addresses, *_ in plan) + " addresses...[/yellow]")
+
+    # One live progress display with a task per category. Each category is driven from its own
+    # thread, but all of their queries share one pool, so --max-workers caps the whole run
+    with ThreadPoolExecutor(max_workers=max_workers) as query_executor:
+        with new_progress() as progress, ThreadPoolExecutor(max_workers=max(len(plan), 1)) as category_executor:  # One worker per category
+            for category, _, addresses, query_fn, *_ in plan:
+                futures[category_executor.submit(query_fn, addresses, max_workers, progress, query_executor)] = category
+
+            # Collect results in completion order rather than submission order
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
     
-    # Display results for validator stake addresses
-    total_validator_stakes = 0.0
-    if validator_stake_addresses and 'validator_stakes' in results:
-        validator_data = results['validator_stakes']
-        total_validator_stakes = validator_data['total_combined']
-        
-        # Create validator stakes table
-        validator_table = Table(title="Validator Stake Balance Report")
-        validator_table.add_column("Address", style="cyan", no_wrap=True)
-        validator_table.add_column("Liquid (POKT)", justify="right", style="green")
-        validator_table.add_column("Staked (POKT)", justify="right", style="blue")
-        validator_table.add_column("Validator Rewards (POKT)", justify="right", style="magenta")
-        validator_table.add_column("Total (POKT)", justify="right", style="bold white")
-        validator_table.add_column("Status", justify="center")
-        
-        # Add successful results
-        for address, balance_data in validator_data['results'].items():
-            validator_table.add_row(
-                address,
-                f"{balance_data['liquid']:,.2f}",
-                f"{balance_data['staked']:,.2f}",
-                f"{balance_data['validator_rewards']:,.2f}",
-                f"{balance_data['total']:,.2f}",
-                "[green]✓[/green]"
-            )
-        
-        # Add failed results
-        for address, error in validator_data['failed']:
-            validator_table.add_row(
-                address,
-                "0.00",
-                "0.00",
-                "0.00",
-                "0.00",
-                "[red]✗[/red]"
-            )
-        
-        # Add total
-        validator_table.add_section()
-        validator_table.add_row(
-            "[bold]TOTAL[/bold]",
-            f"[bold green]{validator_data['total_liquid']:,.2f}[/bold green]",
-            f"[bold blue]{validator_data['total_staked']:,.2f}[/bold blue]",
-            f"[bold magenta]{validator_data['total_validator_rewards']:,.2f}[/bold magenta]",
-            f"[bold white]{total_validator_stakes:,.2f}[/bold white]",
-            f"[dim]{len(validator_data['results'])}/{len(validator_stake_addresses)}[/dim]"
-        )
-        
-        console.print("\n")
-        console.print(validator_table)
-        
-        if validator_data['failed']:
-            console.print(f"\n[red]Failed validator stake queries ({len(validator_data['failed'])}):[/red]")
-            for address, error in validator_data['failed']:
-                console.print(f"  [red]•[/red] {address}: {error}")
+    console.print(f"[green]✓ All queries completed![/green]\n")
     
-    # Display results for delegator stake addresses
-    total_delegator_stakes = 0.0
-    if delegator_stake_addresses and 'delegator_stakes' in results:
-        delegator_data = results['delegator_stakes']
-        total_delegator_stakes = delegator_data['total_combined']
-        
-        # Create delegator stakes table
-        delegator_table = Table(title="Delegator Stake Balance Report")
-        delegator_table.add_column("Address", style="cyan", no_wrap=True)
-        delegator_table.add_column("Liquid (POKT)", justify="right", style="green")
-        delegator_table.add_column("Delegator Rewards (POKT)", justify="right", style="yellow")
-        delegator_table.add_column("Total (POKT)", justify="right", style="bold white")
-        delegator_table.add_column("Status", justify="center")
-        
-        # Add successful results
-        for address, balance_data in delegator_data['results'].items():
-            delegator_table.add_row(
-                address,
-                f"{balance_data['liquid']:,.2f}",
-                f"{balance_data['delegator_rewards']:,.2f}",
-                f"{balance_data['total']:,.2f}",
-                "[green]✓[/green]"
-            )
-        
-        # Add failed results
-        for address, error in delegator_data['failed']:
-            delegator_table.add_row(
-                address,
-                "0.00",
-                "0.00",
-                "0.00",
-                "[red]✗[/red]"
-            )
-        
-        # Add total
-        delegator_table.add_section()
-        delegator_table.add_row(
-            "[bold]TOTAL[/bold]",
-            f"[bold green]{delegator_data['total_liquid']:,.2f}[/bold green]",
-            f"[bold yellow]{delegator_data['total_delegator_rewards']:,.2f}[/bold yellow]",
-            f"[bold white]{total_delegator_stakes:,.2f}[/bold white]",
-            f"[dim]{len(delegator_data['results'])}/{len(delegator_stake_addresses)}[/dim]"
-        )
-        
-        console.print("\n")
-        console.print(delegator_table)
-        
-        if delegator_data['failed']:
-            console.print(f"\n[red]Failed delegator stake queries ({len(delegator_data['failed'])}):[/red]")
-            for address, error in delegator_data['failed']:
+    # One report table per category, in plan order; the last column of each is the category total
+    category_totals = {}
+    for i, (category, label, _, _, title, columns) in enumerate(plan):
+        data = results[category]
+        category_totals[category] = data[columns[-1][2]]
+
+        if i:
+            console.print("\n")
+        console.print(new_report_table(title, columns, data))
+
+        if data['failed']:
+            console.print(f"\n[red]Failed {label} queries ({len(data['failed'])}):[/red]")
+            for address, error in data['failed']:
                 console.print(f"  [red]•[/red] {address}: {error}")
     
     # Grand total summary
-    grand_total = total_liquid_all + total_app_stakes + total_node_stakes + total_validator_stakes + total_delegator_stakes
+    total_liquid_all = category_totals.get('liquid', 0.0)
+    total_app_stakes = category_totals.get('app_stakes', 0.0)
+    total_node_stakes = category_totals.get('node_stakes', 0.0)
+    total_validator_stakes = category_totals.get('validator_stakes', 0.0)
+    total_delegator_stakes = category_totals.get('delegator_stakes', 0.0)
+    grand_total = sum(category_totals.values())
     
     console.print("\n" + "="*60)
     console.print("[bold]TREASURY SUMMARY[/bold]")
@@ -2127,6 +2079,7 @@ def unstake(
     signer_key: str = typer.Option(None, "--signer-key", help="Keyring name to use for signing. This key must exist in the specified keyring."),
     keyring_backend: str = typer.Option("test", "--keyring-backend", help="Keyring backend to use (default: test)"),
     pwd: str = typer.Option("12345678", "--pwd", help="Password for keyring operations (default: 12345678)"),
+    max_workers: int = typer.Option(1, "--max-workers", help="Unstake transactions to broadcast in parallel (default: 1)"),
     h: bool = typer.Option(False, "-h", help="Show this help message and exit", hidden=True),
 ):
     """
@@ -2139,6 +2092,7 @@ def unstake(
     --signer-key: Keyring name to use for signing (must exist in keyring)
     --keyring-backend: Keyring backend to use (default: test)
     --pwd: Password for keyring operations when using 'os' backend (default: 12345678)
+    --max-workers: Unstake transactions to broadcast in parallel (default: 1)
     """
     if h:
         console.print(ctx.get_help())
@@ -2162,155 +2116,130 @@ def unstake(
         console.print(f"[red]File not found:[/red] {operator_addresses_file}")
         raise typer.Exit(1)
 
-    with operator_addresses_file.open() as f:
-        addresses = [line.strip() for line in f if line.strip()]
+    # One read, one pass: blank lines and '#' comments are skipped
+    addresses = [
+        line for line in map(str.strip, operator_addresses_file.read_text().splitlines())
+        if line and not line.startswith("#")
+    ]
 
     console.print(f"[yellow]Loaded {len(addresses)} addresses from {operator_addresses_file}[/yellow]")
     if not addresses:
         console.print("[red]No addresses found in the file. Exiting.[/red]")
         raise typer.Exit(1)
 
-    for address in addresses:
-        cmd = [
-            "pocketd", "tx", "supplier", "unstake-supplier", address,
-            "--from", signer_key,
-            "--network", "main",
-            "--home", str(home),
-            "--gas=auto",
-            "--gas-adjustment=2.0",
-            "--fees=200upokt",
-            f"--keyring-backend={keyring_backend}",
-            "--unordered",
-            "--timeout-duration=1m",
-            "-y"  # Auto-confirm transactions
-        ]
+    tx_flags = [
+        "--from", signer_key,
+        "--network", "main",
+        "--home", str(home),
+        "--gas=auto",
+        "--gas-adjustment=2.0",
+        "--fees=200upokt",
+        f"--keyring-backend={keyring_backend}",
+        "--unordered",
+        "--timeout-duration=1m",
+        "-y"  # Auto-confirm transactions
+    ]
+    # For 'os' keyring backend, provide password via stdin
+    stdin_input = f"{pwd}\n" if keyring_backend == "os" else None
 
-        console.print(f"[cyan]Unstaking {address}...[/cyan]")
-        # For 'os' keyring backend, provide password via stdin
-        stdin_input = f"{pwd}\n" if keyring_backend == "os" else None
-        result = subprocess.run(cmd, input=stdin_input, text=True)
-        if result.returncode == 0:
-            console.print(f"[green]Success:[/green] {address}")
-        else:
-            console.print(f"[red]Failed:[/red] {address}")
+    # Resolved binary path, so the parallel broadcasts do not search PATH for every address
+    pocketd = rpc.pocketd_path() or "pocketd"
+
+    def unstake_supplier(address: str) -> subprocess.CompletedProcess:
+        cmd = [pocketd, "tx", "supplier", "unstake-supplier", address, *tx_flags]
+        return subprocess.run(cmd, input=stdin_input, capture_output=True, text=True)
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Unordered transactions carry no account sequence, so they can be broadcast concurrently
+    # when --max-workers is raised; results are still reported in file order
+    console.print(f"[cyan]Unstaking {len(addresses)} addresses ({max_workers} in parallel)...[/cyan]")
+    success_count = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for address, result in zip(addresses, executor.map(unstake_supplier, addresses)):
+            if result.returncode == 0:
+                success_count += 1
+                txhash = TXHASH_RE.search(result.stdout)
+                console.print(f"[green]Success:[/green] {address}" + (f" [dim]({txhash.group(1)})[/dim]" if txhash else ""))
+            else:
+                console.print(f"[red]Failed:[/red] {address}")
+                console.print(f"  [red]{(result.stderr or result.stdout).strip()}[/red]")
+
+    console.print(f"\n[bold]Unstaked {success_count}/{len(addresses)} addresses[/bold]")
 
 
 def get_node_stake_balance(address: str) -> tuple[float, float, bool, str]:
     """
     Get node stake balance for a single address.
-    Returns (liquid_balance, staked_balance, success, error_message)
+    Returns (liquid_balance, staked_balance, success, error_message); success is False
+    if either balance could not be read, so partial results are never reported or cached.
     """
     # Get liquid balance first
     liquid_balance, liquid_success, liquid_error = get_liquid_balance(address)
+    if not liquid_success:
+        return 0.0, 0.0, False, liquid_error
     
-    # Get staked balance
-    cmd = [
-        "pocketd", "query", "supplier", "show-supplier", address,
-        "--node", "https://shannon-grove-rpc.mainnet.poktroll.com",
-        "--output", "json"
-    ]
-    
+    # Get staked balance (looked up in the bulk listing when one was loaded)
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-        if result.returncode != 0:
-            if liquid_success:
-                return liquid_balance, 0.0, True, "No node stake found"
-            else:
-                return 0.0, 0.0, False, liquid_error or "No node stake found"
-        
-        data = json.loads(result.stdout)
-        supplier = data.get("supplier", {})
-        stake = supplier.get("stake", {})
-        
-        if not stake:
-            if liquid_success:
-                return liquid_balance, 0.0, True, "No node stake found"
-            else:
-                return 0.0, 0.0, False, liquid_error or "No node stake found"
-        
-        upokt_staked = int(stake.get("amount", 0))
-        pokt_staked = upokt_staked / 1_000_000
-        
-        # Return success if either liquid or staked balance exists
-        success = liquid_success or (pokt_staked > 0)
-        error_msg = "" if success else (liquid_error or "No balances found")
-        
-        return liquid_balance, pokt_staked, success, error_msg
-        
-    except subprocess.TimeoutExpired:
-        if liquid_success:
-            return liquid_balance, 0.0, True, "Node stake query timeout"
+        if supplier_stake_listing is not None:
+            stake = supplier_stake_listing.get(address, {})
         else:
-            return 0.0, 0.0, False, "Query timeout"
+            data = rpc.get_client().supplier(address)
+            supplier = data.get("supplier", {})
+            stake = supplier.get("stake", {})
+        
+        # An address without a stake only holds its liquid balance
+        pokt_staked = int(stake.get("amount", 0)) / 1_000_000 if stake else 0.0
+        
+    except QueryTimeout:
+        return liquid_balance, 0.0, False, "Node stake query timeout"
+    except QueryNotFound:
+        pokt_staked = 0.0  # No supplier staked under this address
+    except QueryError as e:
+        return liquid_balance, 0.0, False, f"Node stake query failed: {str(e)}"
     except json.JSONDecodeError:
-        if liquid_success:
-            return liquid_balance, 0.0, True, "Invalid node stake JSON response"
-        else:
-            return 0.0, 0.0, False, "Invalid JSON response"
+        return liquid_balance, 0.0, False, "Invalid node stake JSON response"
     except Exception as e:
-        if liquid_success:
-            return liquid_balance, 0.0, True, f"Node stake error: {str(e)}"
-        else:
-            return 0.0, 0.0, False, str(e)
+        return liquid_balance, 0.0, False, f"Node stake error: {str(e)}"
+    
+    return liquid_balance, pokt_staked, True, ""
 
 
 def get_app_stake_balance(address: str) -> tuple[float, float, bool, str]:
     """
     Get app stake balance for a single address.
-    Returns (liquid_balance, staked_balance, success, error_message)
+    Returns (liquid_balance, staked_balance, success, error_message); success is False
+    if either balance could not be read, so partial results are never reported or cached.
     """
     # Get liquid balance first
     liquid_balance, liquid_success, liquid_error = get_liquid_balance(address)
+    if not liquid_success:
+        return 0.0, 0.0, False, liquid_error
     
-    # Get staked balance
-    cmd = [
-        "pocketd", "query", "application", "show-application", address,
-        "--node", "https://shannon-grove-rpc.mainnet.poktroll.com",
-        "--output", "json"
-    ]
-    
+    # Get staked balance (looked up in the bulk listing when one was loaded)
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-        if result.returncode != 0:
-            if liquid_success:
-                return liquid_balance, 0.0, True, "No app stake found"
-            else:
-                return 0.0, 0.0, False, liquid_error or "No app stake found"
-        
-        data = json.loads(result.stdout)
-        application = data.get("application", {})
-        stake = application.get("stake", {})
-        
-        if not stake:
-            if liquid_success:
-                return liquid_balance, 0.0, True, "No app stake found"
-            else:
-                return 0.0, 0.0, False, liquid_error or "No app stake found"
-        
-        upokt_staked = int(stake.get("amount", 0))
-        pokt_staked = upokt_staked / 1_000_000
-        
-        # Return success if either liquid or staked balance exists
-        success = liquid_success or (pokt_staked > 0)
-        error_msg = "" if success else (liquid_error or "No balances found")
-        
-        return liquid_balance, pokt_staked, success, error_msg
-        
-    except subprocess.TimeoutExpired:
-        if liquid_success:
-            return liquid_balance, 0.0, True, "App stake query timeout"
+        if application_stake_listing is not None:
+            stake = application_stake_listing.get(address, {})
         else:
-            return 0.0, 0.0, False, "Query timeout"
+            data = rpc.get_client().application(address)
+            application = data.get("application", {})
+            stake = application.get("stake", {})
+        
+        # An address without a stake only holds its liquid balance
+        pokt_staked = int(stake.get("amount", 0)) / 1_000_000 if stake else 0.0
+        
+    except QueryTimeout:
+        return liquid_balance, 0.0, False, "App stake query timeout"
+    except QueryNotFound:
+        pokt_staked = 0.0  # No application staked under this address
+    except QueryError as e:
+        return liquid_balance, 0.0, False, f"App stake query failed: {str(e)}"
     except json.JSONDecodeError:
-        if liquid_success:
-            return liquid_balance, 0.0, True, "Invalid app stake JSON response"
-        else:
-            return 0.0, 0.0, False, "Invalid JSON response"
+        return liquid_balance, 0.0, False, "Invalid app stake JSON response"
     except Exception as e:
-        if liquid_success:
-            return liquid_balance, 0.0, True, f"App stake error: {str(e)}"
-        else:
-            return 0.0, 0.0, False, str(e)
+        return liquid_balance, 0.0, False, f"App stake error: {str(e)}"
+    
+    return liquid_balance, pokt_staked, True, ""
 
 
 def get_liquid_balance(address: str) -> tuple[float, bool, str]:
@@ -2318,18 +2247,11 @@ def get_liquid_balance(address: str) -> tuple[float, bool, str]:
     Get liquid balance for a single address.
     Returns (balance, success, error_message)
     """
-    cmd = [
-        "pocketd", "query", "bank", "balances", address,
-        "--node", "https://shannon-grove-rpc.mainnet.poktroll.com",
-        "--output", "json"
-    ]
+    if address in liquid_balance_cache:
+        return liquid_balance_cache[address], True, ""
     
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-        if result.returncode != 0:
-            return 0.0, False, result.stderr.strip() or "Unknown error"
-        
-        data = json.loads(result.stdout)
+        data = rpc.get_client().bank_balances(address)
         balances = data.get("balances", [])
         
         # Look for upokt balance
@@ -2341,42 +2263,73 @@ def get_liquid_balance(address: str) -> tuple[float, bool, str]:
         
         # Convert from upokt to pokt (divide by 1,000,000)
         pokt_balance = upokt_balance / 1_000_000
+        liquid_balance_cache[address] = pokt_balance
         return pokt_balance, True, ""
         
-    except subprocess.TimeoutExpired:
+    except QueryTimeout:
         return 0.0, False, "Query timeout"
+    except QueryError as e:
+        return 0.0, False, str(e) or "Unknown error"
     except json.JSONDecodeError:
         return 0.0, False, "Invalid JSON response"
     except Exception as e:
         return 0.0, False, str(e)
 
 
+def get_liquid_balances(addresses: list[str]) -> list[tuple[float, bool, str]]:
+    """
+    Get liquid balances for a batch of addresses with one batched node request.
+    Returns (balance, success, error_message) per address, in order.
+    """
+    errors = {}
+    pending = [address for address in addresses if address not in liquid_balance_cache]
+    if pending:
+        try:
+            amounts = rpc.get_client().bank_balance_batch(pending)
+        except QueryTimeout:
+            amounts = [QueryTimeout("Query timeout")] * len(pending)
+        except Exception:
+            # Node rejected the batch (e.g. batching disabled): query one by one
+            return [get_liquid_balance(address) for address in addresses]
+        
+        for address, amount in zip(pending, amounts):
+            if isinstance(amount, QueryError):
+                errors[address] = str(amount) or "Unknown error"
+            else:
+                liquid_balance_cache[address] = amount / 1_000_000
+    
+    return [
+        (liquid_balance_cache[address], True, "") if address in liquid_balance_cache else (0.0, False, errors[address])
+        for address in addresses
+    ]
+
+
+def upokt_amount(coin) -> float:
+    """
+    Amount of a upokt coin, given as a REST {"denom", "amount"} object or a
+    pocketd "<amount>upokt" string (amounts may be decimal, e.g. "300491.88upokt").
+    Returns 0 for other denoms or unparseable amounts.
+    """
+    if isinstance(coin, str):
+        match = UPOKT_AMOUNT_RE(coin)
+        return float(match.group(1)) if match else 0.0
+    try:
+        if isinstance(coin, dict) and coin.get("denom") == "upokt":
+            return float(coin.get("amount", 0))
+    except ValueError:
+        pass
+    return 0.0
+
+
+@functools.lru_cache(maxsize=4096)
 def get_validator_account_address(validator_operator_address: str) -> tuple[str, bool, str]:
     """
     Convert validator operator address to Bech32 account address.
     Returns (account_address, success, error_message)
     """
-    cmd = [
-        "pocketd", "debug", "addr", validator_operator_address
-    ]
-    
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-        if result.returncode != 0:
-            return "", False, result.stderr.strip() or "Failed to convert address"
-        
-        # Parse the output to extract Bech32 Acc address
-        lines = result.stdout.split('\n')
-        for line in lines:
-            if line.strip().startswith('Bech32 Acc:'):
-                account_address = line.split('Bech32 Acc:')[1].strip()
-                return account_address, True, ""
-        
-        return "", False, "Could not find Bech32 Acc address in output"
-        
-    except subprocess.TimeoutExpired:
-        return "", False, "Address conversion timeout"
-    except Exception as e:
+        return bech32.convert_prefix(validator_operator_address, "pokt"), True, ""
+    except ValueError as e:
         return "", False, f"Address conversion error: {str(e)}"
 
 
@@ -2385,43 +2338,26 @@ def get_delegator_rewards(account_address: str) -> tuple[float, bool, str]:
     Get delegator rewards for an account address.
     Returns (rewards_balance, success, error_message)
     """
-    cmd = [
-        "pocketd", "query", "distribution", "rewards", account_address,
-        "--node", "https://shannon-grove-rpc.mainnet.poktroll.com",
-        "--output", "json"
-    ]
-    
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-        if result.returncode != 0:
-            return 0.0, True, ""  # No rewards is still a successful query
-        
-        data = json.loads(result.stdout)
-        rewards = data.get("rewards", [])
+        data = rpc.get_client().delegator_rewards(account_address)
+        rewards = data.get("rewards") or []
         
         if not rewards:
             return 0.0, True, ""  # No rewards is still a successful query
         
         # Sum up all upokt rewards
-        total_upokt = 0.0
-        for reward_entry in rewards:
-            reward_list = reward_entry.get("reward", [])
-            for reward in reward_list:
-                if isinstance(reward, str) and reward.endswith("upokt"):
-                    # Handle decimal amounts like "300491.883966650000000000upokt"
-                    amount_str = reward.replace("upokt", "")
-                    try:
-                        amount = float(amount_str)
-                        total_upokt += amount
-                    except ValueError:
-                        continue
+        total_upokt = sum(upokt_amount(reward) for reward_entry in rewards for reward in reward_entry.get("reward") or [])
         
         # Convert from upokt to pokt (divide by 1,000,000)
         pokt_rewards = total_upokt / 1_000_000
         return pokt_rewards, True, ""
         
-    except subprocess.TimeoutExpired:
+    except QueryTimeout:
         return 0.0, False, "Delegator rewards query timeout"
+    except QueryNotFound:
+        return 0.0, True, ""  # No rewards is still a successful query
+    except QueryError as e:
+        return 0.0, False, f"Delegator rewards query failed: {str(e)}"
     except json.JSONDecodeError:
         return 0.0, False, "Invalid delegator rewards JSON response"
     except Exception as e:
@@ -2431,7 +2367,8 @@ def get_delegator_rewards(account_address: str) -> tuple[float, bool, str]:
 def get_delegator_stake_balance(address: str) -> tuple[float, float, bool, str]:
     """
     Get delegator stake balance for a single address (liquid + delegator rewards).
-    Returns (liquid_balance, delegator_rewards, success, error_message)
+    Returns (liquid_balance, delegator_rewards, success, error_message); success is False
+    if either query failed.
     """
     # Get liquid balance
     liquid_balance, liquid_success, liquid_error = get_liquid_balance(address)
@@ -2439,13 +2376,12 @@ def get_delegator_stake_balance(address: str) -> tuple[float, float, bool, str]:
     # Get delegator rewards
     delegator_rewards, delegator_success, delegator_error = get_delegator_rewards(address)
     
-    # Return success if either liquid or delegator rewards exist
-    success = liquid_success or delegator_success
-    error_msg = ""
-    if not success:
-        error_msg = f"Liquid: {liquid_error or 'Unknown error'}; Delegator: {delegator_error or 'Unknown error'}"
-    
-    return liquid_balance, delegator_rewards, success, error_msg
+    errors = [
+        f"{name}: {error or 'Unknown error'}"
+        for name, ok, error in (("Liquid", liquid_success, liquid_error), ("Delegator", delegator_success, delegator_error))
+        if not ok
+    ]
+    return liquid_balance, delegator_rewards, not errors, "; ".join(errors)
 
 
 def get_validator_outstanding_rewards(validator_operator_address: str) -> tuple[float, bool, str]:
@@ -2453,329 +2389,416 @@ def get_validator_outstanding_rewards(validator_operator_address: str) -> tuple[
     Get validator outstanding rewards for a validator operator address.
     Returns (rewards_balance, success, error_message)
     """
-    cmd = [
-        "pocketd", "query", "distribution", "validator-outstanding-rewards", validator_operator_address,
-        "--node", "https://shannon-grove-rpc.mainnet.poktroll.com",
-        "--output", "json"
-    ]
-    
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-        if result.returncode != 0:
-            return 0.0, True, ""  # No rewards is still a successful query
-        
-        data = json.loads(result.stdout)
-        rewards = data.get("rewards", {})
+        data = rpc.get_client().validator_outstanding_rewards(validator_operator_address)
+        rewards = data.get("rewards") or {}
         
         if not rewards:
             return 0.0, True, ""  # No rewards is still a successful query
         
         # Get the rewards list
-        rewards_list = rewards.get("rewards", [])
+        rewards_list = rewards.get("rewards") or []
         
         if not rewards_list:
             return 0.0, True, ""
         
         # Sum up all upokt rewards
-        total_upokt = 0.0
-        for reward in rewards_list:
-            if reward.endswith("upokt"):
-                # Handle decimal amounts like "4202756595.434928297608388076upokt"
-                amount_str = reward.replace("upokt", "")
-                try:
-                    amount = float(amount_str)
-                    total_upokt += amount
-                except ValueError:
-                    continue
+        total_upokt = sum(upokt_amount(reward) for reward in rewards_list)
         
         # Convert from upokt to pokt (divide by 1,000,000)
         pokt_rewards = total_upokt / 1_000_000
         return pokt_rewards, True, ""
         
-    except subprocess.TimeoutExpired:
+    except QueryTimeout:
         return 0.0, False, "Validator outstanding rewards query timeout"
+    except QueryNotFound:
+        return 0.0, True, ""  # No rewards is still a successful query
+    except QueryError as e:
+        return 0.0, False, f"Validator outstanding rewards query failed: {str(e)}"
     except json.JSONDecodeError:
         return 0.0, False, "Invalid validator outstanding rewards JSON response"
     except Exception as e:
         return 0.0, False, f"Validator outstanding rewards error: {str(e)}"
 
 
+def get_validator_stake(validator_operator_address: str) -> tuple[float, bool, str]:
+    """
+    Get the bonded stake of a validator operator address.
+    Returns (staked_balance, success, error_message); no stake is still a successful query.
+    """
+    try:
+        data = rpc.get_client().validator(validator_operator_address)
+        validator = data.get("validator", {})
+        tokens = validator.get("tokens") or "0"
+        
+        # Convert from upokt to pokt (divide by 1,000,000)
+        return int(tokens) / 1_000_000, True, ""
+        
+    except QueryTimeout:
+        return 0.0, False, "Validator stake query timeout"
+    except QueryNotFound:
+        return 0.0, True, ""  # No validator with this operator address
+    except QueryError as e:
+        return 0.0, False, f"Validator stake query failed: {str(e)}"
+    except json.JSONDecodeError:
+        return 0.0, False, "Invalid validator stake JSON response"
+    except Exception as e:
+        return 0.0, False, f"Validator stake error: {str(e)}"
+
+
 def get_validator_stake_balance(address: str) -> tuple[float, float, float, bool, str]:
     """
     Get validator stake balance and rewards for a single address (excluding delegator rewards).
-    Returns (liquid_balance, staked_balance, validator_rewards, success, error_message)
+    Returns (liquid_balance, staked_balance, validator_rewards, success, error_message);
+    success is False if any of the three queries failed.
     """
-    # First convert validator operator address to account address
+    # Convert validator operator address to account address
     account_address, addr_success, addr_error = get_validator_account_address(address)
     
     if not addr_success:
         return 0.0, 0.0, 0.0, False, f"Address conversion failed: {addr_error}"
     
-    # Get liquid balance using the account address
+    # One query at a time: validators are already queried in parallel on the shared
+    # worker pool, which caps the run's concurrent requests at --max-workers
     liquid_balance, liquid_success, liquid_error = get_liquid_balance(account_address)
-    
-    # Get validator outstanding rewards using the original validator operator address
     validator_rewards, validator_success, validator_error = get_validator_outstanding_rewards(address)
+    pokt_staked, stake_success, stake_error = get_validator_stake(address)
     
-    # Get validator stake balance using the original operator address
-    cmd = [
-        "pocketd", "query", "staking", "validator", address,
-        "--node", "https://shannon-grove-rpc.mainnet.poktroll.com",
-        "--output", "json"
+    errors = [
+        error or "Unknown error"
+        for ok, error in ((liquid_success, liquid_error), (validator_success, validator_error), (stake_success, stake_error))
+        if not ok
     ]
-    
+    return liquid_balance, pokt_staked, validator_rewards, not errors, "; ".join(errors)
+
+
+def enable_balance_cache(ttl: float) -> None:
+    """Open the on-disk results cache; the run continues uncached if it cannot be opened."""
+    global balance_cache
+    import sqlite3
+    from .balance_cache import BalanceCache
+
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-        if result.returncode != 0:
-            # Return what we have even if staking query fails
-            success = liquid_success or validator_success
-            return liquid_balance, 0.0, validator_rewards, success, "No validator stake found"
-        
-        data = json.loads(result.stdout)
-        validator = data.get("validator", {})
-        tokens = validator.get("tokens", "0")
-        
-        if not tokens or tokens == "0":
-            # Return what we have even if no stake
-            success = liquid_success or validator_success
-            return liquid_balance, 0.0, validator_rewards, success, "No validator stake found"
-        
-        # Convert from upokt to pokt (divide by 1,000,000)
-        upokt_staked = int(tokens)
-        pokt_staked = upokt_staked / 1_000_000
-        
-        # Return success if any balance exists
-        success = liquid_success or (pokt_staked > 0) or validator_success
-        error_msg = "" if success else "No balances found"
-        
-        return liquid_balance, pokt_staked, validator_rewards, success, error_msg
-        
-    except subprocess.TimeoutExpired:
-        success = liquid_success or validator_success
-        return liquid_balance, 0.0, validator_rewards, success, "Validator stake query timeout"
-    except json.JSONDecodeError:
-        success = liquid_success or validator_success
-        return liquid_balance, 0.0, validator_rewards, success, "Invalid validator stake JSON response"
-    except Exception as e:
-        success = liquid_success or validator_success
-        return liquid_balance, 0.0, validator_rewards, success, f"Validator stake error: {str(e)}"
+        balance_cache = BalanceCache(ttl=ttl)
+    except (OSError, sqlite3.Error) as e:
+        console.print(f"[yellow]Warning: Result cache unavailable, querying everything ({e})[/yellow]")
+
+
+def cached_results(kind: str, addresses: list[str]) -> tuple[dict, list[str]]:
+    """Split addresses into results still fresh in the on-disk cache and the addresses left to query."""
+    if balance_cache is None:
+        return {}, addresses
+    if balance_cache.height is None:
+        # One height check per run; results stored at this height are reused regardless of age.
+        # Without a height (e.g. --use-cli with no pocketd binary: OSError) only the TTL applies
+        try:
+            balance_cache.height = rpc.get_client().latest_height()
+        except (QueryError, KeyError, ValueError, OSError):
+            pass
+    results = balance_cache.get_many(kind, addresses)
+    return results, [address for address in addresses if address not in results]
 
 
-def query_liquid_balances_parallel(addresses: list[str], max_workers: int = 10) -> dict:
+def store_results(kind: str, results: dict, queried: list[str], errors: Optional[dict] = None) -> None:
     """
-    Query liquid balances for multiple addresses in parallel.
-    Returns dict with results and metadata for progress tracking.
+    Write the successful results for the addresses queried this run back to the on-disk
+    cache, skipping any address whose query reported an error (in `errors`).
     """
-    results = {}
-    failed = []
-    completed_count = 0
-    total_count = len(addresses)
-    lock = threading.Lock()
-    
-    def query_single_liquid(address: str):
-        nonlocal completed_count
-        balance, success, error = get_liquid_balance(address)
-        
-        with lock:
-            completed_count += 1
-            console.print(f"[dim]Liquid {completed_count}/{total_count}: {address}... done[/dim]")
-            
-            if success:
-                results[address] = balance
-            else:
-                failed.append((address, error))
-    
-    # Execute queries in parallel
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [executor.submit(query_single_liquid, addr) for addr in addresses]
-        for future in as_completed(futures):
-            future.result()  # Wait for completion and handle exceptions
-    
-    return {
-        'results': results,
-        'failed': failed,
-        'total_balance': sum(results.values())
-    }
+    if balance_cache is not None:
+        errors = errors or {}
+        balance_cache.set_many(
+            kind, {address: results[address] for address in queried if address in results and not errors.get(address)}
+        )
 
 
-def query_app_stakes_parallel(addresses: list[str], max_workers: int = 10) -> dict:
+def load_stake_listing(kind: str, addresses: list[str], executor) -> None:
     """
-    Query app stake balances for multiple addresses in parallel.
-    Returns dict with results and metadata for progress tracking.
+    For BULK_STAKE_THRESHOLD or more addresses, load the stakes of every supplier
+    (kind "node") or application (kind "app") with one paginated listing, keeping
+    only the given addresses. Pages are fetched on executor, so call this from
+    outside its workers. On failure the getters keep querying per address.
     """
-    results = {}
-    failed = []
-    completed_count = 0
-    total_count = len(addresses)
-    lock = threading.Lock()
-    
-    def query_single_app(address: str):
-        nonlocal completed_count
-        liquid_balance, staked_balance, success, error = get_app_stake_balance(address)
-        
-        with lock:
-            completed_count += 1
-            console.print(f"[dim]App stake {completed_count}/{total_count}: {address}... done[/dim]")
-            
-            if success:
-                results[address] = {
-                    'liquid': liquid_balance,
-                    'staked': staked_balance,
-                    'total': liquid_balance + staked_balance
-                }
-            else:
-                failed.append((address, error))
-    
-    # Execute queries in parallel
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [executor.submit(query_single_app, addr) for addr in addresses]
-        for future in as_completed(futures):
-            future.result()  # Wait for completion and handle exceptions
-    
-    return {
-        'results': results,
-        'failed': failed,
-        'total_liquid': sum(r['liquid'] for r in results.values()),
-        'total_staked': sum(r['staked'] for r in results.values()),
-        'total_combined': sum(r['total'] for r in results.values())
-    }
+    global supplier_stake_listing, application_stake_listing
+    if len(addresses) < BULK_STAKE_THRESHOLD:
+        return
+
+    wanted = set(addresses)
+    try:
+        if kind == "node":
+            suppliers = rpc.get_client().suppliers(executor=executor).get("supplier") or []
+            supplier_stake_listing = {
+                s["operator_address"]: s.get("stake") or {} for s in suppliers if s.get("operator_address") in wanted
+            }
+        else:
+            applications = rpc.get_client().applications(executor=executor).get("applications") or []
+            application_stake_listing = {
+                a["address"]: a.get("stake") or {} for a in applications if a.get("address") in wanted
+            }
+    except QueryError:
+        pass
+
+
+def liquid_batches(addresses: list[str]) -> list[list[str]]:
+    """Split addresses into LIQUID_BATCH_SIZE chunks for batched liquid balance lookups."""
+    return [addresses[i:i + LIQUID_BATCH_SIZE] for i in range(0, len(addresses), LIQUID_BATCH_SIZE)]
 
 
-def query_node_stakes_parallel(addresses: list[str], max_workers: int = 10) -> dict:
+def submit_liquid_batches(addresses: list[str], executor) -> list:
+    """Start batched liquid balance lookups for addresses on executor; returns their futures."""
+    return [executor.submit(get_liquid_balances, batch) for batch in liquid_batches(addresses)]
+
+
+def prefetch_liquid_balances(addresses: list[str], executor) -> None:
     """
-    Query node stake balances for multiple addresses in parallel.
-    Returns dict with results and metadata for progress tracking.
+    Warm liquid_balance_cache for addresses with batched lookups on executor, so
+    the per-address stake getters that follow reuse them instead of issuing one
+    liquid balance query each.
+    """
+    from concurrent.futures import wait
+
+    wait(submit_liquid_batches(addresses, executor))
+
+
+def query_liquid_balances_parallel(
+    addresses: list[str],
+    max_workers: int = 10,
+    progress: Optional["Progress"] = None,
+    executor: Optional["ThreadPoolExecutor"] = None,
+) -> dict:
+    """
+    Query liquid balances for multiple addresses in parallel, on `executor` if given.
+    Returns dict with the addresses queried (repeats dropped), results and metadata
+    for progress tracking.
     """
-    results = {}
     failed = []
-    completed_count = 0
-    total_count = len(addresses)
-    lock = threading.Lock()
-    
-    def query_single_node(address: str):
-        nonlocal completed_count
-        liquid_balance, staked_balance, success, error = get_node_stake_balance(address)
-        
-        with lock:
-            completed_count += 1
-            console.print(f"[dim]Node stake {completed_count}/{total_count}: {address}... done[/dim]")
-            
-            if success:
-                results[address] = {
-                    'liquid': liquid_balance,
-                    'staked': staked_balance,
-                    'total': liquid_balance + staked_balance
-                }
-            else:
-                failed.append((address, error))
-    
-    # Execute queries in parallel
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [executor.submit(query_single_node, addr) for addr in addresses]
+    unique_addresses = list(dict.fromkeys(addresses))  # Query repeated addresses once
+    total_count = len(unique_addresses)
+    results, addresses = cached_results("liquid", unique_addresses)
+    from concurrent.futures import as_completed
+    
+    # Execute batches in parallel; results are recorded on this thread as they complete, so no lock is needed
+    batches = liquid_batches(addresses)
+    with query_progress("Liquid", total_count, progress) as advance, worker_pool(max_workers, executor) as executor:
+        advance(len(results))
+        futures = {executor.submit(get_liquid_balances, batch): batch for batch in batches}
         for future in as_completed(futures):
-            future.result()  # Wait for completion and handle exceptions
+            for address, (balance, success, error) in zip(futures[future], future.result()):
+                if success:
+                    results[address] = balance
+                else:
+                    failed.append((address, error))
+            advance(len(futures[future]))
     
+    store_results("liquid", results, addresses)
+
     return {
+        'addresses': unique_addresses,
         'results': results,
         'failed': failed,
-        'total_liquid': sum(r['liquid'] for r in results.values()),
-        'total_staked': sum(r['staked'] for r in results.values()),
-        'total_combined': sum(r['total'] for r in results.values())
+        'total_balance': sum(results.values())
     }
 
 
-def query_delegator_stakes_parallel(addresses: list[str], max_workers: int = 10) -> dict:
+def prefetch_app_stakes(addresses: list[str], executor) -> None:
+    from concurrent.futures import wait
+
+    # The listing is driven from this thread (its pages run on executor) while the liquid batches run
+    liquid_batches_done = submit_liquid_batches(addresses, executor)
+    load_stake_listing("app", addresses, executor)
+    wait(liquid_batches_done)
+
+
+def prefetch_node_stakes(addresses: list[str], executor) -> None:
+    from concurrent.futures import wait
+
+    # The listing is driven from this thread (its pages run on executor) while the liquid batches run
+    liquid_batches_done = submit_liquid_batches(addresses, executor)
+    load_stake_listing("node", addresses, executor)
+    wait(liquid_batches_done)
+
+
+def prefetch_validator_stakes(addresses: list[str], executor) -> None:
+    # Liquid balances are held by the validators' account addresses
+    account_addresses = [account for account, ok, _ in map(get_validator_account_address, addresses) if ok]
+    prefetch_liquid_balances(account_addresses, executor)
+
+
+# Stake categories: progress label, per-address getter, names of the POKT amounts the getter
+# returns ahead of (success, error), and the prefetch run before the per-address queries
+STAKE_QUERIES = {
+    "app_stakes": ("App stake", get_app_stake_balance, ("liquid", "staked"), prefetch_app_stakes),
+    "node_stakes": ("Node stake", get_node_stake_balance, ("liquid", "staked"), prefetch_node_stakes),
+    "delegator_stakes": ("Delegator stake", get_delegator_stake_balance, ("liquid", "delegator_rewards"), prefetch_liquid_balances),
+    "validator_stakes": ("Validator stake", get_validator_stake_balance, ("liquid", "staked", "validator_rewards"), prefetch_validator_stakes),
+}
+
+
+def query_stakes_parallel(
+    kind: str,
+    addresses: list[str],
+    max_workers: int = 10,
+    progress: Optional["Progress"] = None,
+    executor: Optional["ThreadPoolExecutor"] = None,
+) -> dict:
     """
-    Query delegator stake balances for multiple addresses in parallel.
-    Returns dict with results and metadata for progress tracking.
+    Query one stake category (a STAKE_QUERIES key) for multiple addresses in parallel,
+    on `executor` if given.
+    Returns dict with the addresses queried (repeats dropped), per-address results
+    ({amount: POKT, ..., 'total': POKT}), failed (address, error) pairs, a
+    total_<amount> per amount and total_combined.
     """
-    results = {}
+    label, get_balance, amounts, prefetch = STAKE_QUERIES[kind]
     failed = []
-    completed_count = 0
-    total_count = len(addresses)
-    lock = threading.Lock()
-    
-    def query_single_delegator(address: str):
-        nonlocal completed_count
-        liquid_balance, delegator_rewards, success, error = get_delegator_stake_balance(address)
-        
-        with lock:
-            completed_count += 1
-            console.print(f"[dim]Delegator stake {completed_count}/{total_count}: {address}... done[/dim]")
+    errors = {}  # address -> error reported by the getter, successful or not
+    unique_addresses = list(dict.fromkeys(addresses))  # Query repeated addresses once
+    total_count = len(unique_addresses)
+    results, addresses = cached_results(kind, unique_addresses)
+    from concurrent.futures import as_completed
+
+    # Running totals, starting from the cached results and added to as each query completes
+    totals = {f'total_{amount}': sum(r[amount] for r in results.values()) for amount in amounts}
+    totals['total_combined'] = sum(r['total'] for r in results.values())
+    
+    # Execute queries in parallel; results are recorded on this thread as they complete, so no lock is needed
+    with query_progress(label, total_count, progress) as advance, worker_pool(max_workers, executor) as executor:
+        advance(len(results))
+        prefetch(addresses, executor)
+        futures = {executor.submit(get_balance, addr): addr for addr in addresses}
+        for future in as_completed(futures):
+            address = futures[future]
+            *balances, success, error = future.result()
+            advance()
+            if error:
+                errors[address] = error
             
             if success:
-                results[address] = {
-                    'liquid': liquid_balance,
-                    'delegator_rewards': delegator_rewards,
-                    'total': liquid_balance + delegator_rewards
-                }
+                result = dict(zip(amounts, balances))
+                result['total'] = sum(balances)
+                results[address] = result
+                for amount, balance in zip(amounts, balances):
+                    totals[f'total_{amount}'] += balance
+                totals['total_combined'] += result['total']
             else:
                 failed.append((address, error))
     
-    # Execute queries in parallel
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [executor.submit(query_single_delegator, addr) for addr in addresses]
-        for future in as_completed(futures):
-            future.result()  # Wait for completion and handle exceptions
-    
+    store_results(kind, results, addresses, errors)
+
     return {
+        'addresses': unique_addresses,
         'results': results,
         'failed': failed,
-        'total_liquid': sum(r['liquid'] for r in results.values()),
-        'total_delegator_rewards': sum(r['delegator_rewards'] for r in results.values()),
-        'total_combined': sum(r['total'] for r in results.values())
+        **totals,
     }
 
 
-def query_validator_stakes_parallel(addresses: list[str], max_workers: int = 10) -> dict:
+# Per-category entry points used by treasury and treasury-tools
+query_app_stakes_parallel = functools.partial(query_stakes_parallel, "app_stakes")
+query_node_stakes_parallel = functools.partial(query_stakes_parallel, "node_stakes")
+query_delegator_stakes_parallel = functools.partial(query_stakes_parallel, "delegator_stakes")
+query_validator_stakes_parallel = functools.partial(query_stakes_parallel, "validator_stakes")
+
+
+# Numeric report columns of the treasury-tools subcommands: (header, result field, total field, style).
+# Liquid results are plain balances rather than dicts, hence the None field.
+LIQUID_COLUMNS = [("Balance (POKT)", None, "total_balance", "green")]
+APP_STAKE_COLUMNS = NODE_STAKE_COLUMNS = [
+    ("Liquid (POKT)", "liquid", "total_liquid", "green"),
+    ("Staked (POKT)", "staked", "total_staked", "blue"),
+    ("Total (POKT)", "total", "total_combined", "magenta"),
+]
+VALIDATOR_STAKE_COLUMNS = [
+    ("Liquid (POKT)", "liquid", "total_liquid", "green"),
+    ("Staked (POKT)", "staked", "total_staked", "blue"),
+    ("Validator Rewards (POKT)", "validator_rewards", "total_validator_rewards", "magenta"),
+    ("Total (POKT)", "total", "total_combined", "bold white"),
+]
+DELEGATOR_STAKE_COLUMNS = [
+    ("Liquid (POKT)", "liquid", "total_liquid", "green"),
+    ("Delegator Rewards (POKT)", "delegator_rewards", "total_delegator_rewards", "yellow"),
+    ("Total (POKT)", "total", "total_combined", "bold white"),
+]
+
+
+def new_report_table(title: str, columns: list[tuple], data: dict) -> "Table":
+    """
+    Build the report table for one category from a query_*_parallel result: a row
+    per address (failed ones as 0.00) and a TOTAL row from the precomputed totals.
+    """
+    table = new_table(title)
+    table.add_column("Address", style="cyan", no_wrap=True)
+    for header, _, _, style in columns:
+        table.add_column(header, justify="right", style=style)
+    table.add_column("Status", justify="center")
+
+    results = data['results']
+    fields = [field for _, field, _, _ in columns]
+    rows = [
+        (address, *(format_pokt(r if field is None else r[field]) for field in fields), OK_CELL)
+        for address, r in results.items()
+    ]
+    failed_cells = ("0.00",) * len(columns)
+    rows += [(address, *failed_cells, FAIL_CELL) for address, error in data['failed']]
+    add_rows(table, rows)
+
+    # Add separator row and totals
+    table.add_section()
+    table.add_row(
+        "[bold]TOTAL[/bold]",
+        *(f"[bold {style}]{data[total]:,.2f}[/]" for _, _, total, style in columns),
+        f"[dim]{len(results)}/{len(data['addresses'])}[/dim]"
+    )
+    return table
+
+
+def run_treasury_tool(
+    addresses_file: Path,
+    json_key: str,
+    description: str,
+    title: str,
+    columns: list[tuple],
+    query_fn,
+    max_workers: int,
+) -> None:
     """
-    Query validator stake balances for multiple addresses in parallel.
-    Returns dict with results and metadata for progress tracking.
+    Shared body of the treasury-tools subcommands: load the addresses, query them
+    in parallel with query_fn and print the report table plus any failures.
     """
-    results = {}
-    failed = []
-    completed_count = 0
-    total_count = len(addresses)
-    lock = threading.Lock()
+    if not addresses_file.exists():
+        console.print(f"[red]File not found:[/red] {addresses_file}")
+        raise typer.Exit(1)
+
+    addresses = load_addresses_from_file(addresses_file, json_key)
+
+    if not addresses:
+        console.print("[red]No addresses found in the file. Exiting.[/red]")
+        raise typer.Exit(1)
+
+    console.print(f"[yellow]Querying {description} for {len(addresses)} addresses...[/yellow]")
+    rpc.set_client(rpc.NodeClient(max_connections=max_workers))
     
-    def query_single_validator(address: str):
-        nonlocal completed_count
-        liquid_balance, staked_balance, validator_rewards, success, error = get_validator_stake_balance(address)
-        
-        with lock:
-            completed_count += 1
-            console.print(f"[dim]Validator stake {completed_count}/{total_count}: {address}... done[/dim]")
-            
-            if success:
-                results[address] = {
-                    'liquid': liquid_balance,
-                    'staked': staked_balance,
-                    'validator_rewards': validator_rewards,
-                    'total': liquid_balance + staked_balance + validator_rewards
-                }
-            else:
-                failed.append((address, error))
+    # Query in parallel; the helper returns per-address results and precomputed totals
+    data = query_fn(addresses, max_workers)
+    results = data['results']
+    failed_addresses = data['failed']
     
-    # Execute queries in parallel
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [executor.submit(query_single_validator, addr) for addr in addresses]
-        for future in as_completed(futures):
-            future.result()  # Wait for completion and handle exceptions
+    # Display results table
+    console.print("\n")
+    console.print(new_report_table(title, columns, data))
     
-    return {
-        'results': results,
-        'failed': failed,
-        'total_liquid': sum(r['liquid'] for r in results.values()),
-        'total_staked': sum(r['staked'] for r in results.values()),
-        'total_validator_rewards': sum(r['validator_rewards'] for r in results.values()),
-        'total_combined': sum(r['total'] for r in results.values())
-    }
+    console.print(f"[dim]Successfully queried: {len(results)}/{len(data['addresses'])} addresses[/dim]")
+    
+    # Show failed addresses if any
+    if failed_addresses:
+        console.print(f"\n[red]Failed to query {len(failed_addresses)} addresses:[/red]")
+        for address, error in failed_addresses:
+            console.print(f"  [red]•[/red] {address}: {error}")
 
 
 @treasury_app.command()
 def app_stakes(
     ctx: typer.Context,
     addresses_file: Path = typer.Option(None, "--file", help="Path to file with addresses (text file with one per line, or JSON file with 'app_stakes' array)."),
+    max_workers: int = typer.Option(10, "--max-workers", help="Maximum concurrent requests (default: 10)"),
     h: bool = typer.Option(False, "-h", help="Show this help message and exit", hidden=True),
 ):
     """
@@ -2787,6 +2810,9 @@ def app_stakes(
 
     Required options:
     --file: Path to file with addresses
+
+    Optional options:
+    --max-workers: Maximum concurrent requests (default: 10)
     """
     if h:
         console.print(ctx.get_help())
@@ -2797,91 +2823,21 @@ def app_stakes(
         console.print("Calculate app stake balances (liquid + staked) for addresses listed in a file.\n")
         console.print("[bold]Required Options:[/bold]")
         console.print("  [cyan]--file[/cyan]  Path to file with addresses, one per line")
+        console.print("\n[bold]Optional Options:[/bold]")
+        console.print("  [cyan]--max-workers[/cyan]  Maximum concurrent requests (default: 10)")
         console.print("\n[bold]Example:[/bold]")
         console.print("  pocketknife treasury-tools app-stakes --file addresses.txt")
         console.print("\n[dim]Use 'pocketknife treasury-tools app-stakes --help' for full help.[/dim]")
         raise typer.Exit(1)
     
-    if not addresses_file.exists():
-        console.print(f"[red]File not found:[/red] {addresses_file}")
-        raise typer.Exit(1)
-
-    addresses = load_addresses_from_file(addresses_file, "app_stakes")
-
-    if not addresses:
-        console.print("[red]No addresses found in the file. Exiting.[/red]")
-        raise typer.Exit(1)
-
-    console.print(f"[yellow]Querying app stake balances for {len(addresses)} addresses...[/yellow]")
-    
-    # Create table for results
-    table = Table(title="App Stake Balance Report")
-    table.add_column("Address", style="cyan", no_wrap=True)
-    table.add_column("Liquid (POKT)", justify="right", style="green")
-    table.add_column("Staked (POKT)", justify="right", style="blue")
-    table.add_column("Total (POKT)", justify="right", style="magenta")
-    table.add_column("Status", justify="center")
-    
-    successful_queries = []
-    failed_addresses = []
-    total_liquid = 0.0
-    total_staked = 0.0
-    
-    for i, address in enumerate(addresses, 1):
-        console.print(f"[dim]Querying {i}/{len(addresses)}: {address}[/dim]")
-        
-        liquid_balance, staked_balance, success, error = get_app_stake_balance(address)
-        total_balance = liquid_balance + staked_balance
-        
-        if success:
-            successful_queries.append((address, liquid_balance, staked_balance, total_balance))
-            total_liquid += liquid_balance
-            total_staked += staked_balance
-            table.add_row(
-                address,
-                f"{liquid_balance:,.2f}",
-                f"{staked_balance:,.2f}",
-                f"{total_balance:,.2f}",
-                "[green]✓[/green]"
-            )
-        else:
-            failed_addresses.append((address, error))
-            table.add_row(
-                address,
-                "0.00",
-                "0.00", 
-                "0.00",
-                "[red]✗[/red]"
-            )
-    
-    # Add separator row and totals
-    table.add_section()
-    grand_total = total_liquid + total_staked
-    table.add_row(
-        "[bold]TOTAL[/bold]",
-        f"[bold green]{total_liquid:,.2f}[/bold green]",
-        f"[bold blue]{total_staked:,.2f}[/bold blue]",
-        f"[bold magenta]{grand_total:,.2f}[/bold magenta]",
-        f"[dim]{len(successful_queries)}/{len(addresses)}[/dim]"
-    )
-    
-    # Display results table
-    console.print("\n")
-    console.print(table)
-    
-    console.print(f"[dim]Successfully queried: {len(successful_queries)}/{len(addresses)} addresses[/dim]")
-    
-    # Show failed addresses if any
-    if failed_addresses:
-        console.print(f"\n[red]Failed to query {len(failed_addresses)} addresses:[/red]")
-        for address, error in failed_addresses:
-            console.print(f"  [red]•[/red] {address}: {error}")
+    run_treasury_tool(addresses_file, "app_stakes", "app stake balances", "App Stake Balance Report", APP_STAKE_COLUMNS, query_app_stakes_parallel, max_workers)
 
 
 @treasury_app.command()
 def liquid_balance(
     ctx: typer.Context,
     addresses_file: Path = typer.Option(None, "--file", help="Path to file with addresses (text file with one per line, or JSON file with 'liquid' array)."),
+    max_workers: int = typer.Option(10, "--max-workers", help="Maximum concurrent requests (default: 10)"),
     h: bool = typer.Option(False, "-h", help="Show this help message and exit", hidden=True),
 ):
     """
@@ -2893,6 +2849,9 @@ def liquid_balance(
 
     Required options:
     --file: Path to file with addresses
+
+    Optional options:
+    --max-workers: Maximum concurrent requests (default: 10)
     """
     if h:
         console.print(ctx.get_help())
@@ -2904,79 +2863,21 @@ def liquid_balance(
         console.print("Calculate liquid balance for addresses listed in a file.\n")
         console.print("[bold]Required Options:[/bold]")
         console.print("  [cyan]--file[/cyan]  Path to file with addresses, one per line")
+        console.print("\n[bold]Optional Options:[/bold]")
+        console.print("  [cyan]--max-workers[/cyan]  Maximum concurrent requests (default: 10)")
         console.print("\n[bold]Example:[/bold]")
         console.print("  pocketknife treasury-tools liquid-balance --file addresses.txt")
         console.print("\n[dim]Use 'pocketknife treasury-tools liquid-balance --help' for full help.[/dim]")
         raise typer.Exit(1)
     
-    if not addresses_file.exists():
-        console.print(f"[red]File not found:[/red] {addresses_file}")
-        raise typer.Exit(1)
-
-    addresses = load_addresses_from_file(addresses_file, "liquid")
-
-    if not addresses:
-        console.print("[red]No addresses found in the file. Exiting.[/red]")
-        raise typer.Exit(1)
-
-    console.print(f"[yellow]Querying liquid balances for {len(addresses)} addresses...[/yellow]")
-    
-    # Create table for results
-    table = Table(title="Liquid Balance Report")
-    table.add_column("Address", style="cyan", no_wrap=True)
-    table.add_column("Balance (POKT)", justify="right", style="green")
-    table.add_column("Status", justify="center")
-    
-    successful_balances = []
-    failed_addresses = []
-    total_balance = 0.0
-    
-    for i, address in enumerate(addresses, 1):
-        console.print(f"[dim]Querying {i}/{len(addresses)}: {address}[/dim]")
-        
-        balance, success, error = get_liquid_balance(address)
-        
-        if success:
-            successful_balances.append((address, balance))
-            total_balance += balance
-            table.add_row(
-                address,
-                f"{balance:,.2f}",
-                "[green]✓[/green]"
-            )
-        else:
-            failed_addresses.append((address, error))
-            table.add_row(
-                address,
-                "0.00",
-                "[red]✗[/red]"
-            )
-    
-    # Add separator row and total
-    table.add_section()
-    table.add_row(
-        "[bold]TOTAL[/bold]",
-        f"[bold green]{total_balance:,.2f}[/bold green]",
-        f"[dim]{len(successful_balances)}/{len(addresses)}[/dim]"
-    )
-    
-    # Display results table
-    console.print("\n")
-    console.print(table)
-    
-    console.print(f"[dim]Successfully queried: {len(successful_balances)}/{len(addresses)} addresses[/dim]")
-    
-    # Show failed addresses if any
-    if failed_addresses:
-        console.print(f"\n[red]Failed to query {len(failed_addresses)} addresses:[/red]")
-        for address, error in failed_addresses:
-            console.print(f"  [red]•[/red] {address}: {error}")
+    run_treasury_tool(addresses_file, "liquid", "liquid balances", "Liquid Balance Report", LIQUID_COLUMNS, query_liquid_balances_parallel, max_workers)
 
 
 @treasury_app.command()
 def node_stakes(
     ctx: typer.Context,
     addresses_file: Path = typer.Option(None, "--file", help="Path to file with addresses (text file with one per line, or JSON file with 'node_stakes' array)."),
+    max_workers: int = typer.Option(10, "--max-workers", help="Maximum concurrent requests (default: 10)"),
     h: bool = typer.Option(False, "-h", help="Show this help message and exit", hidden=True),
 ):
     """
@@ -2988,6 +2889,9 @@ def node_stakes(
 
     Required options:
     --file: Path to file with addresses
+
+    Optional options:
+    --max-workers: Maximum concurrent requests (default: 10)
     """
     if h:
         console.print(ctx.get_help())
@@ -2999,91 +2903,21 @@ def node_stakes(
         console.print("Calculate node stake balances (liquid + staked) for addresses listed in a file.\n")
         console.print("[bold]Required Options:[/bold]")
         console.print("  [cyan]--file[/cyan]  Path to file with addresses, one per line")
+        console.print("\n[bold]Optional Options:[/bold]")
+        console.print("  [cyan]--max-workers[/cyan]  Maximum concurrent requests (default: 10)")
         console.print("\n[bold]Example:[/bold]")
         console.print("  pocketknife treasury-tools node-stakes --file addresses.txt")
         console.print("\n[dim]Use 'pocketknife treasury-tools node-stakes --help' for full help.[/dim]")
         raise typer.Exit(1)
     
-    if not addresses_file.exists():
-        console.print(f"[red]File not found:[/red] {addresses_file}")
-        raise typer.Exit(1)
-
-    addresses = load_addresses_from_file(addresses_file, "node_stakes")
-
-    if not addresses:
-        console.print("[red]No addresses found in the file. Exiting.[/red]")
-        raise typer.Exit(1)
-
-    console.print(f"[yellow]Querying node stake balances for {len(addresses)} addresses...[/yellow]")
-    
-    # Create table for results
-    table = Table(title="Node Stake Balance Report")
-    table.add_column("Address", style="cyan", no_wrap=True)
-    table.add_column("Liquid (POKT)", justify="right", style="green")
-    table.add_column("Staked (POKT)", justify="right", style="blue")
-    table.add_column("Total (POKT)", justify="right", style="magenta")
-    table.add_column("Status", justify="center")
-    
-    successful_queries = []
-    failed_addresses = []
-    total_liquid = 0.0
-    total_staked = 0.0
-    
-    for i, address in enumerate(addresses, 1):
-        console.print(f"[dim]Querying {i}/{len(addresses)}: {address}[/dim]")
-        
-        liquid_balance, staked_balance, success, error = get_node_stake_balance(address)
-        total_balance = liquid_balance + staked_balance
-        
-        if success:
-            successful_queries.append((address, liquid_balance, staked_balance, total_balance))
-            total_liquid += liquid_balance
-            total_staked += staked_balance
-            table.add_row(
-                address,
-                f"{liquid_balance:,.2f}",
-                f"{staked_balance:,.2f}",
-                f"{total_balance:,.2f}",
-                "[green]✓[/green]"
-            )
-        else:
-            failed_addresses.append((address, error))
-            table.add_row(
-                address,
-                "0.00",
-                "0.00", 
-                "0.00",
-                "[red]✗[/red]"
-            )
-    
-    # Add separator row and totals
-    table.add_section()
-    grand_total = total_liquid + total_staked
-    table.add_row(
-        "[bold]TOTAL[/bold]",
-        f"[bold green]{total_liquid:,.2f}[/bold green]",
-        f"[bold blue]{total_staked:,.2f}[/bold blue]",
-        f"[bold magenta]{grand_total:,.2f}[/bold magenta]",
-        f"[dim]{len(successful_queries)}/{len(addresses)}[/dim]"
-    )
-    
-    # Display results table
-    console.print("\n")
-    console.print(table)
-    
-    console.print(f"[dim]Successfully queried: {len(successful_queries)}/{len(addresses)} addresses[/dim]")
-    
-    # Show failed addresses if any
-    if failed_addresses:
-        console.print(f"\n[red]Failed to query {len(failed_addresses)} addresses:[/red]")
-        for address, error in failed_addresses:
-            console.print(f"  [red]•[/red] {address}: {error}")
+    run_treasury_tool(addresses_file, "node_stakes", "node stake balances", "Node Stake Balance Report", NODE_STAKE_COLUMNS, query_node_stakes_parallel, max_workers)
 
 
 @treasury_app.command()
 def validator_stakes(
     ctx: typer.Context,
     addresses_file: Path = typer.Option(None, "--file", help="Path to file with addresses (text file with one per line, or JSON file with 'validator_stakes' array)."),
+    max_workers: int = typer.Option(10, "--max-workers", help="Maximum concurrent requests (default: 10)"),
     h: bool = typer.Option(False, "-h", help="Show this help message and exit", hidden=True),
 ):
     """
@@ -3095,6 +2929,9 @@ def validator_stakes(
 
     Required options:
     --file: Path to file with addresses
+
+    Optional options:
+    --max-workers: Maximum concurrent requests (default: 10)
     """
     if h:
         console.print(ctx.get_help())
@@ -3106,97 +2943,21 @@ def validator_stakes(
         console.print("Calculate validator stake balances (liquid + staked + delegator rewards + validator rewards) for addresses listed in a file.\n")
         console.print("[bold]Required Options:[/bold]")
         console.print("  [cyan]--file[/cyan]  Path to file with addresses, one per line")
+        console.print("\n[bold]Optional Options:[/bold]")
+        console.print("  [cyan]--max-workers[/cyan]  Maximum concurrent requests (default: 10)")
         console.print("\n[bold]Example:[/bold]")
         console.print("  pocketknife treasury-tools validator-stakes --file addresses.txt")
         console.print("\n[dim]Use 'pocketknife treasury-tools validator-stakes --help' for full help.[/dim]")
         raise typer.Exit(1)
     
-    if not addresses_file.exists():
-        console.print(f"[red]File not found:[/red] {addresses_file}")
-        raise typer.Exit(1)
-
-    addresses = load_addresses_from_file(addresses_file, "validator_stakes")
-
-    if not addresses:
-        console.print("[red]No addresses found in the file. Exiting.[/red]")
-        raise typer.Exit(1)
-
-    console.print(f"[yellow]Querying validator stake balances for {len(addresses)} addresses...[/yellow]")
-    
-    # Create table for results
-    table = Table(title="Validator Stake Balance Report")
-    table.add_column("Address", style="cyan", no_wrap=True)
-    table.add_column("Liquid (POKT)", justify="right", style="green")
-    table.add_column("Staked (POKT)", justify="right", style="blue")
-    table.add_column("Validator Rewards (POKT)", justify="right", style="magenta")
-    table.add_column("Total (POKT)", justify="right", style="bold white")
-    table.add_column("Status", justify="center")
-    
-    successful_queries = []
-    failed_addresses = []
-    total_liquid = 0.0
-    total_staked = 0.0
-    total_validator_rewards = 0.0
-    
-    for i, address in enumerate(addresses, 1):
-        console.print(f"[dim]Querying {i}/{len(addresses)}: {address}[/dim]")
-        
-        liquid_balance, staked_balance, validator_rewards, success, error = get_validator_stake_balance(address)
-        total_balance = liquid_balance + staked_balance + validator_rewards
-        
-        if success:
-            successful_queries.append((address, liquid_balance, staked_balance, validator_rewards, total_balance))
-            total_liquid += liquid_balance
-            total_staked += staked_balance
-            total_validator_rewards += validator_rewards
-            table.add_row(
-                address,
-                f"{liquid_balance:,.2f}",
-                f"{staked_balance:,.2f}",
-                f"{validator_rewards:,.2f}",
-                f"{total_balance:,.2f}",
-                "[green]✓[/green]"
-            )
-        else:
-            failed_addresses.append((address, error))
-            table.add_row(
-                address,
-                "0.00",
-                "0.00", 
-                "0.00",
-                "0.00",
-                "[red]✗[/red]"
-            )
-    
-    # Add separator row and totals
-    table.add_section()
-    grand_total = total_liquid + total_staked + total_validator_rewards
-    table.add_row(
-        "[bold]TOTAL[/bold]",
-        f"[bold green]{total_liquid:,.2f}[/bold green]",
-        f"[bold blue]{total_staked:,.2f}[/bold blue]",
-        f"[bold magenta]{total_validator_rewards:,.2f}[/bold magenta]",
-        f"[bold white]{grand_total:,.2f}[/bold white]",
-        f"[dim]{len(successful_queries)}/{len(addresses)}[/dim]"
-    )
-    
-    # Display results table
-    console.print("\n")
-    console.print(table)
-    
-    console.print(f"[dim]Successfully queried: {len(successful_queries)}/{len(addresses)} addresses[/dim]")
-    
-    # Show failed addresses if any
-    if failed_addresses:
-        console.print(f"\n[red]Failed to query {len(failed_addresses)} addresses:[/red]")
-        for address, error in failed_addresses:
-            console.print(f"  [red]•[/red] {address}: {error}")
+    run_treasury_tool(addresses_file, "validator_stakes", "validator stake balances", "Validator Stake Balance Report", VALIDATOR_STAKE_COLUMNS, query_validator_stakes_parallel, max_workers)
 
 
 @treasury_app.command()
 def delegator_stakes(
     ctx: typer.Context,
     addresses_file: Path = typer.Option(None, "--file", help="Path to file with addresses (text file with one per line, or JSON file with 'delegator_stakes' array)."),
+    max_workers: int = typer.Option(10, "--max-workers", help="Maximum concurrent requests (default: 10)"),
     h: bool = typer.Option(False, "-h", help="Show this help message and exit", hidden=True),
 ):
     """
@@ -3208,6 +2969,9 @@ def delegator_stakes(
 
     Required options:
     --file: Path to file with addresses
+
+    Optional options:
+    --max-workers: Maximum concurrent requests (default: 10)
     """
     if h:
         console.print(ctx.get_help())
@@ -3222,116 +2986,53 @@ def delegator_stakes(
         console.print("  • JSON file: Extracts from 'delegator_stakes' array")
         console.print("\n[bold]Required Options:[/bold]")
         console.print("  [cyan]--file[/cyan]  Path to file with addresses")
+        console.print("\n[bold]Optional Options:[/bold]")
+        console.print("  [cyan]--max-workers[/cyan]  Maximum concurrent requests (default: 10)")
         console.print("\n[bold]Examples:[/bold]")
         console.print("  pocketknife treasury-tools delegator-stakes --file addresses.txt")
         console.print("  pocketknife treasury-tools delegator-stakes --file treasury.json")
         console.print("\n[dim]Use 'pocketknife treasury-tools delegator-stakes --help' for full help.[/dim]")
         raise typer.Exit(1)
     
-    if not addresses_file.exists():
-        console.print(f"[red]File not found:[/red] {addresses_file}")
-        raise typer.Exit(1)
+    run_treasury_tool(addresses_file, "delegator_stakes", "delegator stake balances", "Delegator Stake Balance Report", DELEGATOR_STAKE_COLUMNS, query_delegator_stakes_parallel, max_workers)
 
-    addresses = load_addresses_from_file(addresses_file, "delegator_stakes")
 
-    if not addresses:
-        console.print("[red]No addresses found in the file. Exiting.[/red]")
-        raise typer.Exit(1)
-
-    console.print(f"[yellow]Querying delegator stake balances for {len(addresses)} addresses...[/yellow]")
-    
-    # Create table for results
-    table = Table(title="Delegator Stake Balance Report")
-    table.add_column("Address", style="cyan", no_wrap=True)
-    table.add_column("Liquid (POKT)", justify="right", style="green")
-    table.add_column("Delegator Rewards (POKT)", justify="right", style="yellow")
-    table.add_column("Total (POKT)", justify="right", style="bold white")
-    table.add_column("Status", justify="center")
-    
-    successful_queries = []
-    failed_addresses = []
-    total_liquid = 0.0
-    total_delegator_rewards = 0.0
-    
-    for i, address in enumerate(addresses, 1):
-        console.print(f"[dim]Querying {i}/{len(addresses)}: {address}[/dim]")
-        
-        liquid_balance, delegator_rewards, success, error = get_delegator_stake_balance(address)
-        total_balance = liquid_balance + delegator_rewards
-        
-        if success:
-            successful_queries.append((address, liquid_balance, delegator_rewards, total_balance))
-            total_liquid += liquid_balance
-            total_delegator_rewards += delegator_rewards
-            table.add_row(
-                address,
-                f"{liquid_balance:,.2f}",
-                f"{delegator_rewards:,.2f}",
-                f"{total_balance:,.2f}",
-                "[green]✓[/green]"
-            )
-        else:
-            failed_addresses.append((address, error))
-            table.add_row(
-                address,
-                "0.00",
-                "0.00",
-                "0.00",
-                "[red]✗[/red]"
-            )
-    
-    # Add separator row and totals
-    table.add_section()
-    grand_total = total_liquid + total_delegator_rewards
-    table.add_row(
-        "[bold]TOTAL[/bold]",
-        f"[bold green]{total_liquid:,.2f}[/bold green]",
-        f"[bold yellow]{total_delegator_rewards:,.2f}[/bold yellow]",
-        f"[bold white]{grand_total:,.2f}[/bold white]",
-        f"[dim]{len(successful_queries)}/{len(addresses)}[/dim]"
-    )
-    
-    # Display results table
-    console.print("\n")
-    console.print(table)
-    
-    console.print(f"[dim]Successfully queried: {len(successful_queries)}/{len(addresses)} addresses[/dim]")
-    
-    # Show failed addresses if any
-    if failed_addresses:
-        console.print(f"\n[red]Failed to query {len(failed_addresses)} addresses:[/red]")
-        for address, error in failed_addresses:
-            console.print(f"  [red]•[/red] {address}: {error}")
+def drop_duplicate_addresses(addresses: list[str], source: str) -> list[str]:
+    """Drop repeated addresses (first occurrence wins), warning about each one found in `source`."""
+    unique_addresses = list(dict.fromkeys(addresses))
+    if len(unique_addresses) != len(addresses):
+        console.print(f"[yellow]Warning: Duplicate addresses found within {source}:[/yellow]")
+        for dup, count in Counter(addresses).items():
+            if count > 1:
+                console.print(f"  [yellow]•[/yellow] {dup} appears {count} times")
+        console.print(f"[yellow]Each address will only be queried once.[/yellow]")
+    return unique_addresses
 
 
 def load_addresses_from_file(file_path: Path, json_key: str) -> list[str]:
     """
     Load addresses from either a JSON file (extracting the specified key) or a text file.
-    Returns list of addresses.
+    Returns list of addresses, each once (with a warning if any were repeated).
     """
-    try:
-        with file_path.open() as f:
-            content = f.read().strip()
-            if content.startswith('{'):
-                # It's a JSON file
-                treasury_data = json.loads(content)
-                addresses = treasury_data.get(json_key, [])
-                if addresses:
-                    console.print(f"[dim]Loaded {len(addresses)} addresses from '{json_key}' section[/dim]")
-                return addresses
-            else:
-                # It's a text file
-                addresses = [line.strip() for line in content.split('\n') if line.strip()]
-                if addresses:
-                    console.print(f"[dim]Loaded {len(addresses)} addresses from text file[/dim]")
-                return addresses
-    except json.JSONDecodeError:
-        # Fall back to text file parsing
-        with file_path.open() as f:
-            addresses = [line.strip() for line in f if line.strip()]
+    # Read as bytes: orjson (via fastjson) parses them without a decode/re-encode round trip
+    content = file_path.read_bytes().strip()
+    if content.startswith(b'{'):
+        try:
+            treasury_data = fastjson.loads(content)
+        except json.JSONDecodeError:
+            # Not valid JSON after all: fall back to text file parsing
+            pass
+        else:
+            addresses = treasury_data.get(json_key, [])
             if addresses:
-                console.print(f"[dim]Loaded {len(addresses)} addresses from text file[/dim]")
-            return addresses
+                console.print(f"[dim]Loaded {len(addresses)} addresses from '{json_key}' section[/dim]")
+            return drop_duplicate_addresses(addresses, f"'{json_key}' array")
+
+    # It's a text file
+    addresses = [line for line in map(str.strip, content.decode().splitlines()) if line]
+    if addresses:
+        console.print(f"[dim]Loaded {len(addresses)} addresses from text file[/dim]")
+    return drop_duplicate_addresses(addresses, "the file")
 
 
 def validate_and_deduplicate_addresses(data: dict) -> dict:
@@ -3339,39 +3040,26 @@ def validate_and_deduplicate_addresses(data: dict) -> dict:
     Validate and deduplicate addresses in treasury data.
     Returns cleaned data or raises exit on errors.
     """
+    # Drop duplicates within each array (first occurrence wins) so each address is queried once
+    for array_name in ("liquid", "app_stakes", "node_stakes", "validator_stakes", "delegator_stakes"):
+        if array_name in data:
+            data[array_name] = drop_duplicate_addresses(data[array_name], f"'{array_name}' array")
+    
     liquid = data.get("liquid", [])
     app_stakes = data.get("app_stakes", [])
     node_stakes = data.get("node_stakes", [])
     validator_stakes = data.get("validator_stakes", [])
     delegator_stakes = data.get("delegator_stakes", [])
     
-    # Check for duplicates within each array
-    for array_name, addresses in [("liquid", liquid), ("app_stakes", app_stakes), ("node_stakes", node_stakes), ("validator_stakes", validator_stakes), ("delegator_stakes", delegator_stakes)]:
-        if len(addresses) != len(set(addresses)):
-            duplicates = [addr for addr in addresses if addresses.count(addr) > 1]
-            unique_duplicates = list(set(duplicates))
-            console.print(f"[red]Error: Duplicate addresses found within '{array_name}' array:[/red]")
-            for dup in unique_duplicates:
-                console.print(f"  [red]•[/red] {dup} appears {addresses.count(dup)} times")
-            console.print(f"[yellow]Please remove duplicates from the '{array_name}' array and try again.[/yellow]")
-            raise typer.Exit(1)
-    
-    # Check for cross-array duplicates
-    all_addresses = set()
-    conflicts = {}
+    # Check for cross-array duplicates; only addresses seen in more than one array get an entry
+    first_seen = {}  # address -> first array it appeared in
+    cross_duplicates = {}  # address -> every array it appears in
     
     for array_name, addresses in [("liquid", liquid), ("app_stakes", app_stakes), ("node_stakes", node_stakes), ("validator_stakes", validator_stakes), ("delegator_stakes", delegator_stakes)]:
         for addr in addresses:
-            if addr in all_addresses:
-                if addr not in conflicts:
-                    conflicts[addr] = []
-                conflicts[addr].append(array_name)
-            else:
-                all_addresses.add(addr)
-                conflicts[addr] = [array_name]
-    
-    # Find addresses that appear in multiple arrays
-    cross_duplicates = {addr: arrays for addr, arrays in conflicts.items() if len(arrays) > 1}
+            first_array = first_seen.setdefault(addr, array_name)
+            if first_array != array_name:
+                cross_duplicates.setdefault(addr, [first_array]).append(array_name)
     
     if cross_duplicates:
         console.print("[red]Error: Addresses found in multiple arrays (will cause double-counting of liquid balances):[/red]")
@@ -3392,8 +3080,7 @@ def load_treasury_addresses(file_path: Path) -> dict:
     Expected format: {"liquid": [...], "app_stakes": [...], "node_stakes": [...], "validator_stakes": [...]}
     """
     try:
-        with file_path.open() as f:
-            data = json.load(f)
+        data = fastjson.loads(file_path.read_bytes())
         
         # Validate structure
         if not isinstance(data, dict):
@@ -3417,59 +3104,46 @@ def load_treasury_addresses(file_path: Path) -> dict:
         raise typer.Exit(1)
 
 
-def fetch_suppliers_for_owner(owner_address: str) -> list[str]:
+def fetch_suppliers_for_owner(owner_address: str, verbose: bool = False) -> list[str]:
     """
     Fetch all supplier operator addresses for a given owner address.
-    Returns a sorted list of unique operator addresses.
+    Returns a sorted list of unique operator addresses; with verbose, each one is printed as found.
     """
     console.print(f"[yellow]Fetching suppliers for owner: {owner_address}[/yellow]")
     
-    cmd = [
-        "pocketd", "q", "supplier", "list-suppliers",
-        "--node", "https://shannon-grove-rpc.mainnet.poktroll.com",
-        "--grpc-insecure=false",
-        "-o", "json",
-        "--page-limit=100000",
-        "--page-count-total"
-    ]
-    
     try:
         console.print("[dim]Querying blockchain for all suppliers...[/dim]")
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
-        
-        if result.returncode != 0:
-            console.print(f"[red]Error fetching suppliers:[/red] {result.stderr.strip()}")
-            raise typer.Exit(1)
-        
-        console.print("[dim]Parsing supplier data...[/dim]")
-        data = json.loads(result.stdout)
+        # Pages are filtered by owner as they arrive; pagination.total still counts every supplier
+        data = rpc.get_client().suppliers(owner_address=owner_address)
         suppliers = data.get("supplier", [])
+        total_suppliers = int((data.get("pagination") or {}).get("total") or 0) or len(suppliers)
         
-        if not suppliers:
+        if not total_suppliers:
             console.print("[red]No suppliers found in the response[/red]")
             raise typer.Exit(1)
         
-        console.print(f"[dim]Found {len(suppliers)} total suppliers, filtering for owner...[/dim]")
+        console.print(f"[dim]Scanned {total_suppliers} total suppliers for owner...[/dim]")
         
-        # Filter suppliers by owner address and collect operator addresses
-        operator_addresses = []
+        # Collect operator addresses of the owner's suppliers (a supplier can show up twice if
+        # pages shift between the concurrent page requests, hence the set)
+        operator_addresses: set[str] = set()
         for supplier in suppliers:
-            if supplier.get("owner_address") == owner_address:
-                operator_addr = supplier.get("operator_address")
-                if operator_addr:
-                    operator_addresses.append(operator_addr)
+            operator_addr = supplier.get("operator_address")
+            if operator_addr and operator_addr not in operator_addresses:
+                operator_addresses.add(operator_addr)
+                if verbose:
                     console.print(f"[green]  ✓[/green] {operator_addr}")
         
-        # Sort and deduplicate
-        unique_addresses = sorted(set(operator_addresses))
+        console.print(f"\n[cyan]Found {len(operator_addresses)} supplier(s)[/cyan]")
         
-        console.print(f"\n[cyan]Found {len(operator_addresses)} supplier(s) ({len(unique_addresses)} unique)[/cyan]")
+        return sorted(operator_addresses)
         
-        return unique_addresses
-        
-    except subprocess.TimeoutExpired:
+    except QueryTimeout:
         console.print("[red]Timeout: Query took too long (>2 minutes)[/red]")
         raise typer.Exit(1)
+    except QueryError as e:
+        console.print(f"[red]Error fetching suppliers:[/red] {e}")
+        raise typer.Exit(1)
     except json.JSONDecodeError as e:
         console.print(f"[red]Error parsing JSON response:[/red] {e}")
         raise typer.Exit(1)
@@ -0,0 +1,10 @@
+import json
+
+# orjson is optional; its JSONDecodeError subclasses json.JSONDecodeError,
+# so callers can keep catching json.JSONDecodeError either way.
+try:
+    import orjson
+except ImportError:
+    loads = json.loads
+else:
+    loads = orjson.loads
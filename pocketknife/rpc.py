@@ -0,0 +1,456 @@
+import base64
+import functools
+import shutil
+import subprocess
+import threading
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Optional
+
+from . import fastjson
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+DEFAULT_NODE_URL = "https://shannon-grove-rpc.mainnet.poktroll.com"
+DEFAULT_API_URL = "https://shannon-grove-api.mainnet.poktroll.com"
+
+
+# gRPC status code the node's REST gateway reports for a missing object
+GRPC_NOT_FOUND = 5
+
+
+class QueryError(Exception):
+    """The node rejected or failed a query."""
+
+
+class QueryNotFound(QueryError):
+    """The queried object (e.g. a supplier, application or validator) does not exist."""
+
+
+class QueryTimeout(QueryError):
+    """The node did not answer a query in time."""
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if not value:
+            out.append(byte)
+            return bytes(out)
+        out.append(byte | 0x80)
+
+
+def _read_varint(buf: bytes, pos: int) -> tuple[int, int]:
+    result = shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def _encode_strings(*values: str) -> bytes:
+    """Protobuf-encode values as string fields 1..n (enough for simple query requests)."""
+    out = bytearray()
+    for field, value in enumerate(values, 1):
+        data = value.encode()
+        out += _varint(field << 3 | 2) + _varint(len(data)) + data
+    return bytes(out)
+
+
+def _decode_fields(buf: bytes) -> dict:
+    """Decode a protobuf message into {field number: raw bytes} for its length-delimited fields."""
+    fields = {}
+    pos = 0
+    while pos < len(buf):
+        key, pos = _read_varint(buf, pos)
+        wire_type = key & 7
+        if wire_type == 2:
+            length, pos = _read_varint(buf, pos)
+            fields[key >> 3] = buf[pos:pos + length]
+            pos += length
+        elif wire_type == 0:
+            _, pos = _read_varint(buf, pos)
+        else:
+            raise QueryError(f"Unexpected protobuf wire type {wire_type}")
+    return fields
+
+
+class NodeClient:
+    """
+    Queries a node's REST (gRPC-gateway) API directly.
+
+    A single pooled HTTP/2 client is shared by all worker threads, so the TCP
+    and TLS handshakes are paid once per run instead of once per pocketd process.
+    """
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_API_URL,
+        max_connections: int = 10,
+        timeout: float = 10.0,
+        rpc_url: str = DEFAULT_NODE_URL,
+        retries: int = 3,
+        connect_timeout: float = 3.0,
+    ):
+        # Imported here: httpx is the slowest import in the CLI and only the query commands need it
+        import httpx
+
+        self.rpc_url = rpc_url
+        # Connection attempts that fail (refused/reset while the pool is being filled) are retried;
+        # requests that reached the node are not, so a slow query still surfaces as QueryTimeout
+        transport = httpx.HTTPTransport(
+            http2=True,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            retries=retries,
+        )
+        # A dead or unreachable endpoint fails within connect_timeout (per attempt) instead of
+        # the full read budget, which stays available to slow queries on a live node
+        self.client = httpx.Client(
+            base_url=base_url,
+            transport=transport,
+            timeout=httpx.Timeout(timeout, connect=min(connect_timeout, timeout)),
+        )
+
+    def get(self, path: str, timeout: Optional[float] = None, **params) -> dict:
+        import httpx
+
+        try:
+            if timeout is None:
+                response = self.client.get(path, params=params or None)
+            else:
+                response = self.client.get(path, params=params or None, timeout=timeout)
+        except httpx.TimeoutException as e:
+            raise QueryTimeout("Query timeout") from e
+        except httpx.HTTPError as e:
+            raise QueryError(str(e)) from e
+
+        if response.status_code != 200:
+            try:
+                body = fastjson.loads(response.content)
+            except ValueError:
+                body = None
+            if not isinstance(body, dict):
+                body = {}
+            # Only a missing object is an answer; 5xx, 429 and the like are failures
+            not_found = response.status_code == 404 or body.get("code") == GRPC_NOT_FOUND
+            raise (QueryNotFound if not_found else QueryError)(body.get("message") or f"HTTP {response.status_code}")
+
+        return fastjson.loads(response.content)
+
+    def abci_query_batch(self, path: str, payloads: list[bytes]) -> list:
+        """
+        Run one abci_query per payload as a single JSON-RPC batch request to the
+        node's RPC endpoint. Returns each raw response value, or a QueryError for
+        queries the node rejected, in payload order.
+        """
+        import httpx
+
+        batch = [
+            {"jsonrpc": "2.0", "id": i, "method": "abci_query", "params": {"path": path, "data": payload.hex()}}
+            for i, payload in enumerate(payloads)
+        ]
+        try:
+            response = self.client.post(self.rpc_url, json=batch)
+        except httpx.TimeoutException as e:
+            raise QueryTimeout("Query timeout") from e
+        except httpx.HTTPError as e:
+            raise QueryError(str(e)) from e
+
+        if response.status_code != 200:
+            raise QueryError(f"HTTP {response.status_code}")
+
+        replies = fastjson.loads(response.content)
+        if not isinstance(replies, list):
+            raise QueryError((replies.get("error") or {}).get("message") or "Batch request rejected")
+
+        results = [QueryError("No response")] * len(payloads)
+        for reply in replies:
+            if "error" in reply:
+                error = reply["error"]
+                results[reply["id"]] = QueryError(error.get("data") or error.get("message", ""))
+                continue
+            answer = reply["result"]["response"]
+            if answer.get("code", 0) != 0:
+                results[reply["id"]] = QueryError(answer.get("log", ""))
+            else:
+                results[reply["id"]] = base64.b64decode(answer.get("value") or "")
+        return results
+
+    def bank_balances(self, address: str) -> dict:
+        return self.get(f"/cosmos/bank/v1beta1/balances/{address}")
+
+    def bank_balance_batch(self, addresses: list[str], denom: str = "upokt") -> list:
+        """Balance of one denom for each address (int, or a QueryError), in one batched request."""
+        values = self.abci_query_batch(
+            "/cosmos.bank.v1beta1.Query/Balance",
+            [_encode_strings(address, denom) for address in addresses],
+        )
+        amounts = []
+        for value in values:
+            if isinstance(value, QueryError):
+                amounts.append(value)
+                continue
+            # QueryBalanceResponse{balance: Coin{denom, amount}}
+            coin = _decode_fields(_decode_fields(value).get(1, b""))
+            amounts.append(int(coin.get(2) or b"0"))
+        return amounts
+
+    def supplier(self, operator_address: str) -> dict:
+        return self.get(f"/pokt-network/poktroll/supplier/supplier/{operator_address}")
+
+    def application(self, address: str) -> dict:
+        return self.get(f"/pokt-network/poktroll/application/application/{address}")
+
+    def _list_all(
+        self,
+        path: str,
+        field: str,
+        page_limit: int,
+        timeout: float,
+        max_workers: int,
+        keep=None,
+        executor: Optional["Executor"] = None,
+    ) -> dict:
+        """
+        Read every page of a paginated list endpoint into {field: [...], "pagination": {"total": ...}}.
+
+        The first page reports the total, then the remaining pages are fetched
+        concurrently by offset and filtered with keep (if given) as they arrive,
+        so only the wanted items are held in memory. pagination.total counts every item.
+        With an executor, every page request runs on its workers (call from outside
+        them); otherwise the remaining pages use a pool of max_workers threads.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        def matching(page: dict) -> list:
+            items = page.get(field) or []
+            return items if keep is None else [item for item in items if keep(item)]
+
+        def fetch_page(**params) -> dict:
+            params = {"pagination.limit": str(page_limit), **params}
+            if executor is not None:
+                return executor.submit(self.get, path, timeout=timeout, **params).result()
+            return self.get(path, timeout=timeout, **params)
+
+        first = fetch_page(**{"pagination.count_total": "true"})
+        items = matching(first)
+        pagination = first.get("pagination") or {}
+        total = int(pagination.get("total") or 0)
+        next_key = pagination.get("next_key")
+
+        if next_key and total:
+            def offset_page(offset: int) -> dict:
+                return self.get(path, timeout=timeout, **{"pagination.limit": str(page_limit), "pagination.offset": str(offset)})
+
+            pages = ThreadPoolExecutor(max_workers=max_workers) if executor is None else nullcontext(executor)
+            with pages as pool:
+                for page in pool.map(offset_page, range(page_limit, total, page_limit)):
+                    items.extend(matching(page))
+        else:
+            # Node did not count the total: follow next_key one page at a time
+            total = len(first.get(field) or [])
+            while next_key:
+                page = fetch_page(**{"pagination.key": next_key})
+                items.extend(matching(page))
+                total += len(page.get(field) or [])
+                next_key = (page.get("pagination") or {}).get("next_key")
+
+        return {field: items, "pagination": {"total": str(total)}}
+
+    def latest_height(self) -> int:
+        """Height of the node's latest block (CometBFT /status on the RPC endpoint)."""
+        data = self.get(f"{self.rpc_url}/status")
+        return int(data["result"]["sync_info"]["latest_block_height"])
+
+    def suppliers(
+        self,
+        page_limit: int = 500,
+        timeout: float = 120.0,
+        owner_address: Optional[str] = None,
+        max_workers: int = 8,
+        executor: Optional["Executor"] = None,
+    ) -> dict:
+        """
+        List suppliers, optionally only those owned by owner_address; same shape as
+        `pocketd query supplier list-suppliers`. Pages are fetched on executor if given.
+        """
+        keep = None if owner_address is None else (lambda s: s.get("owner_address") == owner_address)
+        return self._list_all(
+            "/pokt-network/poktroll/supplier/supplier", "supplier", page_limit, timeout, max_workers, keep, executor
+        )
+
+    def applications(
+        self,
+        page_limit: int = 500,
+        timeout: float = 120.0,
+        max_workers: int = 8,
+        executor: Optional["Executor"] = None,
+    ) -> dict:
+        """
+        List every application; same shape as `pocketd query application list-application`.
+        Pages are fetched on executor if given.
+        """
+        return self._list_all(
+            "/pokt-network/poktroll/application/application", "applications", page_limit, timeout, max_workers, executor=executor
+        )
+
+    def delegator_rewards(self, delegator_address: str) -> dict:
+        return self.get(f"/cosmos/distribution/v1beta1/delegators/{delegator_address}/rewards")
+
+    def validator_outstanding_rewards(self, validator_address: str) -> dict:
+        return self.get(f"/cosmos/distribution/v1beta1/validators/{validator_address}/outstanding_rewards")
+
+    def validator(self, validator_address: str) -> dict:
+        return self.get(f"/cosmos/staking/v1beta1/validators/{validator_address}")
+
+    def close(self):
+        self.client.close()
+
+
+@functools.lru_cache(maxsize=None)
+def pocketd_path() -> Optional[str]:
+    """Absolute path of the pocketd binary (looked up on PATH once), or None if it is not installed."""
+    return shutil.which("pocketd")
+
+
+class PocketdSession:
+    """
+    Runs read-only pocketd queries against a single node.
+
+    pocketd has no batch or stdin mode and its query subcommands accept one
+    address at a time, so every query is still its own process; the session
+    keeps the node/output flags and timeout in one place for all callers.
+    Exposes the same query methods as NodeClient (used with --use-cli).
+    """
+
+    def __init__(self, node: str = DEFAULT_NODE_URL, timeout: int = 10):
+        self.node = node
+        self.timeout = timeout
+        # Flags shared by every query; only the subcommand and address change per call
+        self.query_flags = ("--node", node, "--output", "json")
+
+    def run(self, *args: str, timeout: Optional[int] = None) -> subprocess.CompletedProcess:
+        # Output is kept as bytes: fastjson (orjson) parses them directly, skipping a decode of large listings
+        cmd = (pocketd_path() or "pocketd", "query", *args, *self.query_flags)
+        return subprocess.run(cmd, capture_output=True, timeout=timeout or self.timeout)
+
+    def query(self, *args: str, timeout: Optional[int] = None) -> dict:
+        try:
+            result = self.run(*args, timeout=timeout)
+        except subprocess.TimeoutExpired as e:
+            raise QueryTimeout("Query timeout") from e
+
+        if result.returncode != 0:
+            message = result.stderr.decode(errors="replace").strip()
+            # e.g. "rpc error: code = NotFound desc = supplier with address ... not found"
+            raise (QueryNotFound if "code = NotFound" in message else QueryError)(message)
+
+        return fastjson.loads(result.stdout)
+
+    def latest_height(self) -> int:
+        try:
+            result = subprocess.run(
+                [pocketd_path() or "pocketd", "status", "--node", self.node],
+                capture_output=True, timeout=self.timeout,
+            )
+        except subprocess.TimeoutExpired as e:
+            raise QueryTimeout("Query timeout") from e
+        if result.returncode != 0:
+            raise QueryError(result.stderr.decode(errors="replace").strip())
+        status = fastjson.loads(result.stdout)
+        # Key casing differs between CometBFT versions
+        sync_info = status.get("sync_info") or status.get("SyncInfo") or {}
+        return int(sync_info["latest_block_height"])
+
+    def bank_balances(self, address: str) -> dict:
+        return self.query("bank", "balances", address)
+
+    def bank_balance_batch(self, addresses: list[str], denom: str = "upokt") -> list:
+        amounts = []
+        for address in addresses:
+            try:
+                balances = self.bank_balances(address).get("balances", [])
+            except QueryError as e:
+                amounts.append(e)
+                continue
+            amounts.append(next((int(b.get("amount", 0)) for b in balances if b.get("denom") == denom), 0))
+        return amounts
+
+    def supplier(self, operator_address: str) -> dict:
+        return self.query("supplier", "show-supplier", operator_address)
+
+    def application(self, address: str) -> dict:
+        return self.query("application", "show-application", address)
+
+    def suppliers(
+        self,
+        page_limit: int = 100000,
+        timeout: float = 120.0,
+        owner_address: Optional[str] = None,
+        max_workers: int = 1,
+        executor: Optional["Executor"] = None,
+    ) -> dict:
+        # One pocketd call reads every page; max_workers and executor are accepted for NodeClient parity
+        data = self.query(
+            "supplier", "list-suppliers",
+            "--grpc-insecure=false",
+            f"--page-limit={page_limit}",
+            "--page-count-total",
+            timeout=int(timeout),
+        )
+        if owner_address is not None:
+            data["supplier"] = [s for s in data.get("supplier") or [] if s.get("owner_address") == owner_address]
+        return data
+
+    def applications(
+        self,
+        page_limit: int = 100000,
+        timeout: float = 120.0,
+        max_workers: int = 1,
+        executor: Optional["Executor"] = None,
+    ) -> dict:
+        return self.query(
+            "application", "list-application",
+            "--grpc-insecure=false",
+            f"--page-limit={page_limit}",
+            timeout=int(timeout),
+        )
+
+    def delegator_rewards(self, delegator_address: str) -> dict:
+        return self.query("distribution", "rewards", delegator_address)
+
+    def validator_outstanding_rewards(self, validator_address: str) -> dict:
+        return self.query("distribution", "validator-outstanding-rewards", validator_address)
+
+    def validator(self, validator_address: str) -> dict:
+        return self.query("staking", "validator", validator_address)
+
+    def close(self):
+        pass
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """Return the active query client, creating a NodeClient on first use."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = NodeClient()
+        return _client
+
+
+def set_client(client):
+    """Replace the active query client (e.g. with a PocketdSession for --use-cli)."""
+    global _client
+    with _client_lock:
+        if _client is not None and _client is not client:
+            _client.close()
+        _client = client
@@ -8,7 +8,11 @@ setup(
         "typer>=0.9.0",
         "rich>=13.0.0",
         "pyyaml>=6.0.0",
+        "httpx[http2]>=0.24.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.9.0"],
+    },
     entry_points={
         "console_scripts": [
             "pocketknife=pocketknife.__main__:main",
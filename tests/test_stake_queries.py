@@ -0,0 +1,74 @@
+"""Stake queries must only report (and cache) an address when every one of its queries succeeded."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from pocketknife import cli, rpc
+from pocketknife.balance_cache import BalanceCache
+
+ADDRESS = "pokt1mah7e8zyqs0p60qvwdydc7kaej5sm3sjs7um0a"
+
+
+class FakeClient:
+    """Healthy liquid balances; application() raises the given error, or returns a 2 POKT stake."""
+
+    def __init__(self, application_error=None):
+        self.application_error = application_error
+
+    def latest_height(self) -> int:
+        return 100
+
+    def bank_balance_batch(self, addresses: list[str], denom: str = "upokt") -> list:
+        return [1_500_000] * len(addresses)
+
+    def application(self, address: str) -> dict:
+        if self.application_error is not None:
+            raise self.application_error
+        return {"application": {"stake": {"denom": "upokt", "amount": "2000000"}}}
+
+    def close(self) -> None:
+        pass
+
+
+class AppStakeQueryTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        cli.balance_cache = BalanceCache(path=Path(self.tmp.name) / "cache.sqlite3", ttl=600)
+        cli.liquid_balance_cache.clear()
+        cli.application_stake_listing = None
+
+    def tearDown(self):
+        cli.balance_cache.close()
+        cli.balance_cache = None
+        cli.liquid_balance_cache.clear()
+        rpc.set_client(None)
+        self.tmp.cleanup()
+
+    def query(self, client) -> dict:
+        rpc.set_client(client)
+        return cli.query_app_stakes_parallel([ADDRESS], max_workers=2)
+
+    def test_node_failure_is_neither_reported_nor_cached(self):
+        data = self.query(FakeClient(rpc.QueryError("HTTP 503")))
+
+        self.assertEqual(data["results"], {})
+        self.assertEqual([address for address, _ in data["failed"]], [ADDRESS])
+        self.assertIn("HTTP 503", data["failed"][0][1])
+        self.assertEqual(cli.balance_cache.get_many("app_stakes", [ADDRESS]), {})
+
+        # A later run against a healthy node reads the real stake
+        cli.liquid_balance_cache.clear()
+        data = self.query(FakeClient())
+        self.assertEqual(data["results"][ADDRESS]["staked"], 2.0)
+
+    def test_missing_application_is_a_cached_zero_stake(self):
+        data = self.query(FakeClient(rpc.QueryNotFound("not found")))
+
+        self.assertEqual(data["failed"], [])
+        self.assertEqual(data["results"][ADDRESS], {"liquid": 1.5, "staked": 0.0, "total": 1.5})
+        self.assertEqual(cli.balance_cache.get_many("app_stakes", [ADDRESS]), data["results"])
+
+
+if __name__ == "__main__":
+    unittest.main()